@@ -21,7 +21,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.converter.video import VideoConverter
 
 
-def main():
+def _build_parser():
+    """Configure the argument parser; built once at import."""
     parser = argparse.ArgumentParser(
         description="Video converter with automatic output to 'converted' folder",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -51,7 +52,19 @@ Examples:
                        help='Compression quality (default: medium)')
     parser.add_argument('--resolution', help='Target resolution (e.g., 1920x1080, 1280x720)')
 
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main(argv=None):
+    """Run the converter; argv defaults to sys.argv for CLI use.
+
+    Accepting argv directly lets other Python code (and tests) call
+    main(["video.mp4", "--format", "webm"]) without forking a process.
+    """
+    args = _PARSER.parse_args(argv)
 
     # Validate input file exists
     input_file = Path(args.input_video)
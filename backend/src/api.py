@@ -92,6 +92,29 @@ app.include_router(asr_router)
 app.include_router(ocr_router)
 app.include_router(summarizer_router)
 
+
+@app.on_event("startup")
+async def warm_translator():
+    """
+    Optionally build the shared translator at startup (VOITH_PREWARM_NLLB=1).
+
+    Constructing the singleton here kicks off the NLLB background load
+    before the first translation request, so cold-start weight loading and
+    CUDA init never block a request worker. Failures are logged and the
+    lazy per-request path takes over.
+    """
+    import os
+    if os.getenv("VOITH_PREWARM_NLLB") != "1":
+        return
+    try:
+        import asyncio
+        from src.ocr.api import get_translator
+        await asyncio.to_thread(get_translator)
+        logger.info("Translator singleton pre-warmed at startup")
+    except Exception as e:
+        logger.warning(f"Translator pre-warm failed, deferring to lazy init: {e}")
+
+
 @app.get("/")
 async def root():
     """
@@ -5,6 +5,13 @@ This module provides speech-to-text transcription capabilities with word-level
 timestamps using WhisperX, supporting multiple languages and high accuracy.
 """
 
-from .core import AudioTranscriber
+__all__ = ['AudioTranscriber']
 
-__all__ = ['AudioTranscriber']
\ No newline at end of file
+
+def __getattr__(name):
+    # Lazy re-export: importing the package (e.g. for src.asr.models) no
+    # longer drags in torch/whisperx until the transcriber is actually used
+    if name == 'AudioTranscriber':
+        from .core import AudioTranscriber
+        return AudioTranscriber
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,57 @@
 """
 Utility functions for ASR processing.
 """
+import functools
 import logging
-from pathlib import Path
-from typing import Optional, Tuple
+import os
+import re
+import stat
+import types
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# Pulls format.duration straight out of ffprobe's JSON; a targeted
+# regex over a few KB of output beats parsing the whole document just
+# to read one field
+_DURATION_RE = re.compile(r'"duration"\s*:\s*"([0-9.eE+-]+)"')
+
+# ffprobe invocation shared by every get_audio_duration call; only the
+# file path varies, so the fixed part is built once at import
+_FFPROBE_BASE = (
+    'ffprobe',
+    '-v', 'quiet',
+    '-print_format', 'json',
+    '-show_format',
+)
+
+# Extensions the validators accept; frozenset membership is one hash
+# lookup and the tables are built once at import
+_AUDIO_EXTS = frozenset({
+    '.wav', '.mp3', '.flac', '.m4a', '.ogg', '.aac',
+    '.wma', '.aiff', '.au', '.ra', '.ape'
+})
+_VIDEO_EXTS = frozenset({
+    '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv',
+    '.webm', '.m4v', '.3gp', '.mpg', '.mpeg'
+})
+
+# Rough estimates based on typical WhisperX performance; conservative,
+# and actual times may vary. Read-only so callers cannot mutate the
+# shared table
+_MODEL_FACTORS = types.MappingProxyType({
+    'tiny': 0.3,    # ~0.3x audio duration
+    'base': 0.5,    # ~0.5x audio duration
+    'small': 0.8,   # ~0.8x audio duration
+    'medium': 1.2,  # ~1.2x audio duration
+    'large': 2.0    # ~2.0x audio duration
+})
+
 
 def validate_audio_file(file_path: str) -> Tuple[bool, str]:
     """
@@ -18,28 +63,24 @@ def validate_audio_file(file_path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    path = Path(file_path)
-
-    if not path.exists():
+    # One stat covers existence, the regular-file check, and the size
+    # below; exists()/is_file()/stat() each issued their own syscall
+    try:
+        st = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
         return False, f"File does not exist: {file_path}"
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Path is not a file: {file_path}"
 
-    # Supported audio formats
-    supported_extensions = {
-        '.wav', '.mp3', '.flac', '.m4a', '.ogg', '.aac',
-        '.wma', '.aiff', '.au', '.ra', '.ape'
-    }
-
-    file_ext = path.suffix.lower()
-    if file_ext not in supported_extensions:
-        return False, f"Unsupported audio format: {file_ext}. Supported: {', '.join(sorted(supported_extensions))}"
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext not in _AUDIO_EXTS:
+        return False, f"Unsupported audio format: {file_ext}. Supported: {', '.join(sorted(_AUDIO_EXTS))}"
 
     # Check file size (max 500MB for safety)
     max_size = 500 * 1024 * 1024  # 500MB
-    if path.stat().st_size > max_size:
-        return False, f"File too large: {path.stat().st_size / (1024*1024):.1f}MB. Maximum allowed: {max_size / (1024*1024)}MB"
+    if st.st_size > max_size:
+        return False, f"File too large: {st.st_size / (1024*1024):.1f}MB. Maximum allowed: {max_size / (1024*1024)}MB"
 
     return True, ""
 
@@ -54,72 +95,79 @@ def validate_video_file(file_path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    path = Path(file_path)
-
-    if not path.exists():
+    # Same single-stat pattern as validate_audio_file
+    try:
+        st = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
         return False, f"File does not exist: {file_path}"
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return False, f"Path is not a file: {file_path}"
 
-    # Supported video formats
-    supported_extensions = {
-        '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv',
-        '.webm', '.m4v', '.3gp', '.mpg', '.mpeg'
-    }
-
-    file_ext = path.suffix.lower()
-    if file_ext not in supported_extensions:
-        return False, f"Unsupported video format: {file_ext}. Supported: {', '.join(sorted(supported_extensions))}"
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext not in _VIDEO_EXTS:
+        return False, f"Unsupported video format: {file_ext}. Supported: {', '.join(sorted(_VIDEO_EXTS))}"
 
     # Check file size (max 2GB for safety)
     max_size = 2 * 1024 * 1024 * 1024  # 2GB
-    if path.stat().st_size > max_size:
-        return False, f"File too large: {path.stat().st_size / (1024*1024*1024):.1f}GB. Maximum allowed: {max_size / (1024*1024*1024)}GB"
+    if st.st_size > max_size:
+        return False, f"File too large: {st.st_size / (1024*1024*1024):.1f}GB. Maximum allowed: {max_size / (1024*1024*1024)}GB"
 
     return True, ""
 
 
-def get_audio_duration(file_path: str) -> Optional[float]:
-    """
-    Get audio file duration using ffprobe.
-
-    Args:
-        file_path: Path to audio file
-
-    Returns:
-        Duration in seconds, or None if failed
-    """
+def _probe_audio_duration(file_path: str) -> Optional[float]:
+    """Run ffprobe and pull the duration out of its output."""
     try:
         import subprocess
-        import json
-
-        cmd = [
-            'ffprobe',
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            file_path
-        ]
 
         result = subprocess.run(
-            cmd,
+            (*_FFPROBE_BASE, file_path),
             capture_output=True,
             text=True,
             timeout=30
         )
 
         if result.returncode == 0:
-            data = json.loads(result.stdout)
-            duration = float(data['format']['duration'])
-            return duration
+            match = _DURATION_RE.search(result.stdout)
+            if match:
+                return float(match.group(1))
+            logger.warning(f"No duration found in ffprobe output for {file_path}")
 
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError, ValueError) as e:
+    except (subprocess.TimeoutExpired, ValueError) as e:
         logger.warning(f"Failed to get audio duration for {file_path}: {e}")
 
     return None
 
 
+@functools.lru_cache(maxsize=256)
+def _probe_audio_duration_cached(file_path: str, mtime_ns: int, size: int) -> Optional[float]:
+    """Memoized probe; mtime/size in the key invalidate on file change."""
+    return _probe_audio_duration(file_path)
+
+
+def get_audio_duration(file_path: str) -> Optional[float]:
+    """
+    Get audio file duration using ffprobe.
+
+    Pipelines probe the same file several times (preflight, time
+    estimate, transcription), so results are cached keyed by
+    (path, mtime, size) — an edited file misses the cache automatically.
+
+    Args:
+        file_path: Path to audio file
+
+    Returns:
+        Duration in seconds, or None if failed
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        # No stat means no safe invalidation key; probe uncached
+        return _probe_audio_duration(file_path)
+    return _probe_audio_duration_cached(file_path, st.st_mtime_ns, st.st_size)
+
+
 def format_timestamp(seconds: float) -> str:
     """
     Format seconds into HH:MM:SS.mmm or MM:SS.mmm format.
@@ -130,9 +178,8 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
 
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{secs:05.2f}"
@@ -142,6 +189,36 @@ def format_timestamp(seconds: float) -> str:
         return f"{secs:05.2f}"
 
 
+def format_timestamps(seconds: Sequence[float]) -> List[str]:
+    """
+    Format many timestamps at once.
+
+    The hour/minute/second split is done as three vectorized NumPy
+    operations over the whole array instead of per-element divmod calls;
+    without NumPy this falls back to mapping format_timestamp.
+
+    Args:
+        seconds: Times in seconds
+
+    Returns:
+        List of formatted timestamp strings, one per input
+    """
+    if np is None:
+        return [format_timestamp(s) for s in seconds]
+
+    arr = np.asarray(seconds, dtype=np.float64)
+    hours = (arr // 3600).astype(np.int64)
+    minutes = ((arr % 3600) // 60).astype(np.int64)
+    secs = arr % 60
+
+    return [
+        f"{h:02d}:{m:02d}:{s:05.2f}" if h
+        else f"{m:02d}:{s:05.2f}" if m
+        else f"{s:05.2f}"
+        for h, m, s in zip(hours.tolist(), minutes.tolist(), secs.tolist())
+    ]
+
+
 def estimate_transcription_time(audio_duration: float, model_size: str) -> float:
     """
     Estimate transcription processing time based on audio duration and model.
@@ -153,23 +230,8 @@ def estimate_transcription_time(audio_duration: float, model_size: str) -> float
     Returns:
         Estimated processing time in seconds
     """
-    # Rough estimates based on typical WhisperX performance
-    # These are conservative estimates and actual times may vary
-    model_multipliers = {
-        'tiny': 0.3,    # ~0.3x audio duration
-        'base': 0.5,    # ~0.5x audio duration
-        'small': 0.8,   # ~0.8x audio duration
-        'medium': 1.2,  # ~1.2x audio duration
-        'large': 2.0    # ~2.0x audio duration
-    }
-
-    multiplier = model_multipliers.get(model_size, 1.0)
-    base_time = audio_duration * multiplier
-
-    # Add fixed overhead for model loading and alignment
-    overhead = 10.0  # 10 seconds
-
-    return base_time + overhead
+    # 10s fixed overhead covers model loading and alignment
+    return audio_duration * _MODEL_FACTORS.get(model_size, 1.0) + 10.0
 
 
 def cleanup_temp_files(*file_paths: str) -> None:
@@ -180,10 +242,12 @@ def cleanup_temp_files(*file_paths: str) -> None:
         *file_paths: Paths to files to delete
     """
     for file_path in file_paths:
+        # EAFP: try the unlink directly instead of exists() + unlink(),
+        # which doubles the syscalls and races against concurrent cleanup
         try:
-            path = Path(file_path)
-            if path.exists():
-                path.unlink()
-                logger.debug(f"Cleaned up temporary file: {file_path}")
-        except Exception as e:
+            os.unlink(file_path)
+            logger.debug(f"Cleaned up temporary file: {file_path}")
+        except (FileNotFoundError, IsADirectoryError):
+            pass
+        except OSError as e:
             logger.warning(f"Failed to clean up {file_path}: {e}")
\ No newline at end of file
@@ -47,16 +47,24 @@ class AudioConverter:
 
         try:
             logger.info(f"Running FFmpeg command: {' '.join(cmd)}")
-            result = subprocess.run(
+            # stdout goes straight to /dev/null: ffmpeg can emit megabytes
+            # of progress output that nothing reads on success. Only stderr
+            # is captured, and only for error reporting.
+            subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=True
+                check=True,
+                timeout=600
             )
             logger.info("FFmpeg conversion completed successfully")
             return True
         except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg conversion failed: {e.stderr}")
+            logger.error(f"FFmpeg conversion failed: {e.stderr[:2000] if e.stderr else e}")
+            return False
+        except subprocess.TimeoutExpired:
+            logger.error(f"FFmpeg timed out converting {input_file}")
             return False
         except FileNotFoundError:
             logger.error("FFmpeg not found. Please install FFmpeg.")
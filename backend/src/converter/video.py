@@ -12,6 +12,11 @@ from typing import Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Fields that ffprobe reports per-stream vs. per-container, used to build
+# -show_entries selectors for the fast probe path.
+_STREAM_FIELDS = frozenset({'codec_name', 'codec_type', 'width', 'height', 'pix_fmt', 'avg_frame_rate'})
+_FORMAT_FIELDS = frozenset({'duration', 'size', 'bit_rate', 'format_name'})
+
 
 class VideoConverter:
     """
@@ -285,12 +290,50 @@ class VideoConverter:
 
         return format_args
 
-    def get_video_info(self, file_path: str) -> Optional[Dict[str, Any]]:
+    def _probe_fast(self, file_path: str, entries: str) -> Optional[Dict[str, str]]:
+        """
+        Run a lightweight ffprobe query for specific entries only.
+
+        Unlike the full JSON probe, this asks ffprobe to print just the
+        requested entries as flat `key=value` lines, avoiding JSON
+        serialization of the entire stream/format metadata.
+
+        Args:
+            file_path (str): Path to media file
+            entries (str): ffprobe -show_entries selector (e.g. 'stream=codec_name:format=duration')
+
+        Returns:
+            Optional[Dict[str, str]]: Parsed key/value pairs, or None if failed
+        """
+        cmd = ['ffprobe', '-v', 'error', '-show_entries', entries,
+               '-of', 'default=noprint_wrappers=1', file_path]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to probe video info: {e.stderr}")
+            return None
+        except FileNotFoundError:
+            logger.error("ffprobe not found. Please install FFmpeg.")
+            return None
+
+        info = {}
+        for line in result.stdout.splitlines():
+            key, sep, value = line.partition('=')
+            if sep:
+                info[key.strip()] = value.strip()
+        return info
+
+    def get_video_info(self, file_path: str,
+                       fields: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, Any]]:
         """
         Get video file information using FFmpeg.
 
         Args:
             file_path (str): Path to video file
+            fields (Optional[Tuple[str, ...]]): If given, only these fields are
+                probed via the fast `key=value` path (e.g. ('codec_name',
+                'duration', 'width', 'height')) instead of the full JSON dump.
 
         Returns:
             Optional[Dict[str, Any]]: Video file information, or None if failed
@@ -299,6 +342,19 @@ class VideoConverter:
             logger.error(f"File does not exist: {file_path}")
             return None
 
+        if fields:
+            stream_fields = [f for f in fields if f in _STREAM_FIELDS]
+            format_fields = [f for f in fields if f in _FORMAT_FIELDS]
+            entries = ':'.join(
+                part for part in (
+                    f"stream={','.join(stream_fields)}" if stream_fields else '',
+                    f"format={','.join(format_fields)}" if format_fields else '',
+                ) if part
+            )
+            if entries:
+                return self._probe_fast(file_path, entries)
+            logger.warning(f"No probeable fields in {fields}, falling back to full probe")
+
         try:
             cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', '-show_streams', file_path]
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
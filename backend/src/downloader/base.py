@@ -6,6 +6,7 @@ downloaders in the system. It handles progress tracking, output directory manage
 and resource cleanup through context manager support.
 """
 import logging
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
 from tqdm import tqdm
@@ -32,6 +33,9 @@ class BaseDownloader(ABC):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.pbar = None  # Progress bar instance for download visualization
+        # Progress bars are pure overhead when nobody is watching; checked
+        # once here so headless/CI runs skip tqdm formatting entirely
+        self._interactive = sys.stderr.isatty()
 
         # Future expansion: Add configuration options
         # self.config = {}  # For storing downloader-specific settings
@@ -108,10 +112,13 @@ class BaseDownloader(ABC):
                         unit='B',
                         unit_scale=True,
                         desc="Downloading",
+                        disable=not self._interactive,
+                        mininterval=0.5,
                         bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
                     )
-                self.pbar.n = downloaded
-                self.pbar.refresh()
+                # update() honours mininterval, so thousands of per-chunk
+                # callbacks collapse into at most a couple of redraws per second
+                self.pbar.update(downloaded - self.pbar.n)
 
         elif d['status'] == 'finished':
             # Clean up progress bar on completion
@@ -5,12 +5,70 @@ This module provides a generic downloader that can handle videos from any platfo
 supported by yt-dlp, including YouTube, Vimeo, TikTok, Instagram, and hundreds more.
 """
 import re
+import copy
+import time
+import asyncio
+import hashlib
 import logging
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 import yt_dlp
 from .base import BaseDownloader
 
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    diskcache = None
+
 logger = logging.getLogger(__name__)
 
+# Basic HTTP/HTTPS URL shape check, compiled once at import time
+_URL_PATTERN = re.compile(r'^https?://.+')
+
+# How long cached yt-dlp metadata stays valid. Video metadata (title,
+# duration, formats) rarely changes, so a few hours is safe.
+METADATA_CACHE_TTL = 6 * 60 * 60  # 6 hours
+
+# Query parameters that only carry tracking state and never change which
+# video a URL points to
+_TRACKING_PARAMS = {'si', 'feature'}
+
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize a video URL so equivalent forms share one cache key.
+
+    Lowercases the scheme and host, drops the fragment and tracking
+    parameters (utm_*, si, feature), sorts the remaining query, and expands
+    youtu.be short links to the canonical youtube.com watch URL.
+
+    Args:
+        url (str): Raw video URL
+
+    Returns:
+        str: Canonicalized URL
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = parts.netloc.lower()
+    path = parts.path
+    query_pairs = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _TRACKING_PARAMS and not key.startswith('utm_')
+    ]
+
+    # Expand youtu.be short links to the canonical watch URL
+    if host == 'youtu.be' and len(path) > 1:
+        query_pairs.append(('v', path.lstrip('/')))
+        host = 'www.youtube.com'
+        path = '/watch'
+
+    return urlunsplit((scheme, host, path, urlencode(sorted(query_pairs)), ''))
+
 
 class GenericDownloader(BaseDownloader):
     """
@@ -21,17 +79,42 @@ class GenericDownloader(BaseDownloader):
     and applies the appropriate extraction method.
     """
 
-    def __init__(self, output_dir='./downloads'):
+    #: yt-dlp options for metadata-only queries (no download).
+    _METADATA_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True
+    }
+
+    def __init__(self, output_dir='./downloads', concurrent_fragments: int = 4):
         """
         Initialize the generic downloader.
 
         Args:
             output_dir (str): Directory where downloaded files will be saved
+            concurrent_fragments (int): Number of DASH/HLS fragments yt-dlp
+                fetches in parallel for segmented streams
         """
         super().__init__(output_dir)
+        self.concurrent_fragments = concurrent_fragments
+        # Output template is constant per downloader; build it once
+        self._outtmpl = str(self.output_dir / '%(title)s.%(ext)s')
         self.platform_name = "Generic"
         self.detected_platform = None  # Will be set during download
 
+        # Metadata cache: url -> (fetched_at, extract_info dict). Avoids
+        # repeating the network round-trip when get_platform_info,
+        # get_available_resolutions, and download() hit the same URL.
+        self._meta_cache = {}
+        self._meta_ydl = None  # Shared YoutubeDL instance for metadata queries
+        self._meta_ydl_lock = threading.Lock()
+        self._disk_cache = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                self._disk_cache = diskcache.Cache(str(self.output_dir / '.meta_cache'))
+            except Exception as e:
+                logger.warning(f"Could not open metadata disk cache: {e}")
+
         # Future expansion hooks for enhanced functionality
         # self.max_retries = 3  # Retry failed downloads
         # self.timeout = 300  # Download timeout in seconds
@@ -52,18 +135,91 @@ class GenericDownloader(BaseDownloader):
         Returns:
             bool: True if URL format is valid, False otherwise
         """
-        url_pattern = r'^https?://.+'
-        return bool(re.match(url_pattern, url))
+        return bool(_URL_PATTERN.match(url))
+
+    def _metadata_ydl(self):
+        """
+        Get the shared YoutubeDL instance used for metadata queries.
+
+        Constructing a YoutubeDL loads every extractor and compiles their URL
+        regexes, which costs tens to hundreds of milliseconds. Since metadata
+        queries always use the same options, one instance is created lazily,
+        entered once, and reused for the lifetime of the downloader.
+
+        Returns:
+            yt_dlp.YoutubeDL: The shared metadata-query instance
+        """
+        if self._meta_ydl is None:
+            # Double-checked locking so parallel downloads don't race to
+            # construct multiple instances
+            with self._meta_ydl_lock:
+                if self._meta_ydl is None:
+                    self._meta_ydl = yt_dlp.YoutubeDL(self._METADATA_OPTS).__enter__()
+        return self._meta_ydl
+
+    def _extract_info(self, url: str, refresh: bool = False) -> dict:
+        """
+        Fetch yt-dlp metadata for a URL, with in-process and on-disk caching.
 
-    def get_platform_info(self, url: str) -> dict:
+        Successful `extract_info` results are memoized for METADATA_CACHE_TTL
+        seconds so that the common get_platform_info -> download sequence (and
+        repeated queries for the same URL) pay for at most one network
+        round-trip.
+
+        Args:
+            url (str): Video URL to extract metadata for
+            refresh (bool): If True, bypass the cache and re-fetch
+
+        Returns:
+            dict: Raw yt-dlp extract_info dictionary
+
+        Raises:
+            Exception: Propagated from yt-dlp if extraction fails
+        """
+        url = _canonicalize_url(url)
+        cache_key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+        if not refresh:
+            cached = self._meta_cache.get(cache_key)
+            if cached and time.time() - cached[0] < METADATA_CACHE_TTL:
+                logger.debug(f"Metadata cache hit (memory): {url}")
+                return cached[1]
+
+            if self._disk_cache is not None:
+                info = self._disk_cache.get(cache_key)
+                if info is not None:
+                    logger.debug(f"Metadata cache hit (disk): {url}")
+                    self._meta_cache[cache_key] = (time.time(), info)
+                    return info
+
+        info = self._metadata_ydl().extract_info(url, download=False)
+
+        self._meta_cache[cache_key] = (time.time(), info)
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache.set(cache_key, info, expire=METADATA_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"Could not persist metadata to disk cache: {e}")
+
+        return info
+
+    def clear_metadata_cache(self):
+        """Drop all cached yt-dlp metadata (in-memory and on-disk)."""
+        self._meta_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    def get_platform_info(self, url: str, refresh: bool = False) -> dict:
         """
         Extract platform and video information from URL using yt-dlp.
 
         This method queries yt-dlp to determine the video platform and extract
-        metadata without downloading the actual content.
+        metadata without downloading the actual content. Results are served
+        from the metadata cache when available.
 
         Args:
             url (str): Video URL to analyze
+            refresh (bool): If True, bypass the metadata cache
 
         Returns:
             dict: Platform information containing:
@@ -73,22 +229,15 @@ class GenericDownloader(BaseDownloader):
                 - duration: Video duration in seconds
                 - uploader: Content uploader/channel name
         """
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True
-        }
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'platform': info.get('extractor_key', 'Unknown'),
-                    'platform_name': info.get('extractor', 'Unknown'),
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                }
+            info = self._extract_info(url, refresh=refresh)
+            return {
+                'platform': info.get('extractor_key', 'Unknown'),
+                'platform_name': info.get('extractor', 'Unknown'),
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown'),
+            }
         except Exception as e:
             logger.error(f"Failed to extract platform info: {str(e)}")
             return {
@@ -99,16 +248,18 @@ class GenericDownloader(BaseDownloader):
                 'uploader': 'Unknown',
             }
 
-    def get_available_resolutions(self, url: str) -> list:
+    def get_available_resolutions(self, url: str, refresh: bool = False) -> list:
         """
         Retrieve all available video/audio formats for a given URL.
 
         This method queries yt-dlp to get comprehensive format information
         including resolutions, file types, and quality options available
-        for the specified video.
+        for the specified video. Results are served from the metadata cache
+        when available.
 
         Args:
             url (str): Video URL to query for available formats
+            refresh (bool): If True, bypass the metadata cache
 
         Returns:
             list: List of format dictionaries, each containing:
@@ -117,35 +268,28 @@ class GenericDownloader(BaseDownloader):
                 - resolution: Video resolution (e.g., '720p') or 'audio'
                 - note: Additional format information/notes
         """
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'skip_download': True
-        }
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                formats = []
+            info = self._extract_info(url, refresh=refresh)
+            formats = []
 
-                for f in info.get('formats', []):
-                    height = f.get('height')
+            for f in info.get('formats', []):
+                height = f.get('height')
 
-                    # Determine if this is an audio-only format
-                    if not height and f.get('acodec') != 'none':
-                        resolution = 'audio'
-                    else:
-                        # Format resolution as "720p" for video formats
-                        resolution = f"{height}p" if isinstance(height, int) else str(height)
+                # Determine if this is an audio-only format
+                if not height and f.get('acodec') != 'none':
+                    resolution = 'audio'
+                else:
+                    # Format resolution as "720p" for video formats
+                    resolution = f"{height}p" if isinstance(height, int) else str(height)
 
-                    formats.append({
-                        'format_id': f.get('format_id'),
-                        'ext': f.get('ext'),
-                        'resolution': resolution,
-                        'note': f.get('format_note', '')
-                    })
+                formats.append({
+                    'format_id': f.get('format_id'),
+                    'ext': f.get('ext'),
+                    'resolution': resolution,
+                    'note': f.get('format_note', '')
+                })
 
-                return formats
+            return formats
 
         except Exception as e:
             logger.error(f"Failed to get available resolutions: {str(e)}")
@@ -192,6 +336,12 @@ class GenericDownloader(BaseDownloader):
         logger.info("🔍 Detecting platform and gathering video information...")
         platform_info = self.get_platform_info(url)
         self.detected_platform = platform_info['platform']
+
+        # Grab the raw extract_info dict that get_platform_info just cached;
+        # if it is complete we can hand it to yt-dlp below and skip the
+        # second metadata extraction the download step would otherwise do
+        cached = self._meta_cache.get(hashlib.sha1(_canonicalize_url(url).encode('utf-8')).hexdigest())
+        raw_info = cached[1] if cached else None
         logger.info(f"📺 Detected platform: {self.detected_platform}")
         logger.info(f"🎬 Starting download: {url}")
 
@@ -207,13 +357,23 @@ class GenericDownloader(BaseDownloader):
 
         # Base yt-dlp configuration
         ydl_opts = {
-            'outtmpl': str(self.output_dir / '%(title)s.%(ext)s'),
+            'outtmpl': self._outtmpl,
             'progress_hooks': [self.progress_hook],
             'quiet': True,
             'no_warnings': True,
             'format': ydl_format,
+            # Fetch segmented (DASH/HLS) streams several fragments at a time
+            'concurrent_fragment_downloads': self.concurrent_fragments,
         }
 
+        # Prefer aria2c for multi-connection downloads when it is installed
+        if shutil.which('aria2c'):
+            logger.info("⚡ aria2c detected - using external downloader")
+            ydl_opts['external_downloader'] = 'aria2c'
+            ydl_opts['external_downloader_args'] = {
+                'aria2c': ['-x', '16', '-s', '16', '-k', '1M']
+            }
+
         # Configure audio extraction if requested
         if audio_only:
             logger.info("🎵 Audio extraction enabled - will convert to MP3")
@@ -235,7 +395,13 @@ class GenericDownloader(BaseDownloader):
         try:
             logger.info("🚀 Beginning download process...")
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+                if raw_info and raw_info.get('formats'):
+                    # Metadata already extracted: go straight to format
+                    # selection and download (deep copy because yt-dlp
+                    # mutates the info dict during processing)
+                    ydl.process_ie_result(copy.deepcopy(raw_info), download=True)
+                else:
+                    ydl.download([url])
 
             logger.info(f"✅ Files saved to: {self.output_dir}")
             return {
@@ -254,3 +420,104 @@ class GenericDownloader(BaseDownloader):
         finally:
             # Ensure cleanup happens regardless of success/failure
             self.cleanup()
+
+    def download_many(self, urls: list, max_workers: int = 4, **kwargs) -> list:
+        """
+        Download multiple URLs in parallel with a bounded thread pool.
+
+        Downloads are network-bound, so threads scale near-linearly up to the
+        bandwidth ceiling. Keep max_workers modest (above ~8 risks triggering
+        platform rate limiting).
+
+        Args:
+            urls (list): Video URLs to download
+            max_workers (int): Maximum number of concurrent downloads
+            **kwargs: Options forwarded to download() for every URL
+
+        Returns:
+            list: One result per URL, in input order; failed downloads are
+                  reported as {'url': ..., 'success': False, 'error': ...}
+                  instead of raising
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.download, url, **kwargs): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Download failed for {url}: {str(e)}")
+                    results[url] = {'url': url, 'success': False, 'error': str(e)}
+
+        return [results[url] for url in urls]
+
+    async def aget_platform_info(self, url: str, refresh: bool = False) -> dict:
+        """
+        Async wrapper around get_platform_info.
+
+        Runs the blocking yt-dlp metadata query in a worker thread so async
+        callers (e.g. FastAPI handlers) do not stall the event loop.
+
+        Args:
+            url (str): Video URL to analyze
+            refresh (bool): If True, bypass the metadata cache
+
+        Returns:
+            dict: Same platform information as get_platform_info
+        """
+        return await asyncio.to_thread(self.get_platform_info, url, refresh)
+
+    async def aget_available_resolutions(self, url: str, refresh: bool = False) -> list:
+        """
+        Async wrapper around get_available_resolutions.
+
+        Args:
+            url (str): Video URL to query for available formats
+            refresh (bool): If True, bypass the metadata cache
+
+        Returns:
+            list: Same format list as get_available_resolutions
+        """
+        return await asyncio.to_thread(self.get_available_resolutions, url, refresh)
+
+    async def adownload(self, url: str, **kwargs) -> dict:
+        """
+        Async wrapper around download.
+
+        Offloads the entire (potentially multi-minute) download to a worker
+        thread, keeping the event loop responsive for concurrent requests.
+
+        Args:
+            url (str): Video URL to download
+            **kwargs: Same options as download
+
+        Returns:
+            dict: Same result dictionary as download
+        """
+        return await asyncio.to_thread(lambda: self.download(url, **kwargs))
+
+    async def adownload_many(self, urls: list, concurrency: int = 4) -> list:
+        """
+        Download multiple URLs concurrently with a bounded degree of parallelism.
+
+        Args:
+            urls (list): Video URLs to download
+            concurrency (int): Maximum number of downloads running at once
+
+        Returns:
+            list: One result per URL, in input order; failed downloads are
+                  reported as {'url': ..., 'success': False, 'error': ...}
+                  instead of raising
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded_download(url):
+            async with semaphore:
+                try:
+                    return await self.adownload(url)
+                except Exception as e:
+                    logger.error(f"❌ Download failed for {url}: {str(e)}")
+                    return {'url': url, 'success': False, 'error': str(e)}
+
+        return await asyncio.gather(*(_bounded_download(url) for url in urls))
@@ -5,8 +5,12 @@ This module contains helper functions for time parsing and validation,
 used throughout the downloader system for handling time-based operations
 like video slicing.
 """
+import re
 from typing import Optional
 
+# Matches "mm:ss" or "hh:mm:ss"; the leading hours group is optional
+_TIME_RE = re.compile(r'^(?:(\d+):)?(\d+):(\d+)$')
+
 
 def parse_time(time_str: Optional[str]) -> Optional[int]:
     """
@@ -35,25 +39,21 @@ def parse_time(time_str: Optional[str]) -> Optional[int]:
     if time_str is None:
         return None
 
-    parts = time_str.split(':')
-    try:
-        if len(parts) == 2:
-            # mm:ss format
-            minutes, seconds = map(int, parts)
-            if minutes < 0 or seconds < 0 or seconds >= 60:
-                raise ValueError
-            return minutes * 60 + seconds
-        elif len(parts) == 3:
-            # hh:mm:ss format
-            hours, minutes, seconds = map(int, parts)
-            if hours < 0 or minutes < 0 or minutes >= 60 or seconds < 0 or seconds >= 60:
-                raise ValueError
-            return hours * 3600 + minutes * 60 + seconds
-        else:
-            raise ValueError
-    except ValueError:
+    match = _TIME_RE.match(time_str)
+    if match is None:
         raise ValueError(f"Invalid time format: '{time_str}'. Use 'mm:ss' or 'hh:mm:ss'")
 
+    hours_str, minutes_str, seconds_str = match.groups()
+    hours = int(hours_str) if hours_str else 0
+    minutes = int(minutes_str)
+    seconds = int(seconds_str)
+
+    # Seconds always roll over at 60; minutes only when hours are present
+    if seconds >= 60 or (hours_str and minutes >= 60):
+        raise ValueError(f"Invalid time format: '{time_str}'. Use 'mm:ss' or 'hh:mm:ss'")
+
+    return hours * 3600 + minutes * 60 + seconds
+
 
 def validate_time_range(start_time: Optional[int], end_time: Optional[int]) -> bool:
     """
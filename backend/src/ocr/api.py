@@ -5,14 +5,18 @@ This module provides REST API endpoints for OCR text extraction
 from uploaded images and documents.
 """
 
+import asyncio
 import logging
 import tempfile
+import threading
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from pathlib import Path
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form
-from fastapi.responses import JSONResponse
+import aiofiles
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, Form
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from .core import OCREngine
@@ -21,48 +25,204 @@ from ..summarizer import ContentProcessor
 
 logger = logging.getLogger(__name__)
 
-# Create router
-router = APIRouter()
+# Image file extensions accepted by the OCR endpoints
+ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'}
 
-# Initialize engines (lazy loading)
+# Chunk size for streaming uploads to disk (1 MiB)
+_UPLOAD_CHUNK = 1 << 20
+
+# Maximum accepted upload size; oversized files are rejected before (or
+# while) spooling instead of being written out and handed to the model
+_MAX_UPLOAD_BYTES = int(os.getenv('OCR_MAX_UPLOAD_MB', '25')) * 1024 * 1024
+
+# Pool for per-image translation/summarization in the batch endpoint; both
+# are dominated by GIL-releasing model inference, so threads overlap well
+_POSTPROCESS_POOL = ThreadPoolExecutor(max_workers=min(10, (os.cpu_count() or 1) * 2))
+
+# Create router; orjson serializes the large text payloads these endpoints
+# return several times faster than the stdlib encoder
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+@router.on_event("startup")
+async def warm_engines():
+    """
+    Pre-build the OCR, translation, and summarization engines at startup.
+
+    Without this the first request pays the full multi-second model-load
+    latency (and can hit client timeouts, whose retries re-trigger the
+    load). Warmup runs in worker threads so startup of other routes is not
+    blocked; any failure is logged and the lazy getters remain as fallback.
+    """
+    def _warm_ocr():
+        get_ocr_engine()._initialize_model()
+
+    def _warm_summarizer():
+        get_summarizer("small")._load_model()
+
+    outcomes = await asyncio.gather(
+        asyncio.to_thread(_warm_ocr),
+        asyncio.to_thread(get_translator),
+        asyncio.to_thread(_warm_summarizer),
+        return_exceptions=True
+    )
+    for name, outcome in zip(("OCR", "translator", "summarizer"), outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"{name} warmup failed (will lazy-init on first request): {outcome}")
+        else:
+            logger.info(f"{name} engine warmed at startup")
+
+
+async def _spool_upload(file: UploadFile) -> Optional[str]:
+    """
+    Write one uploaded image to a temporary file without blocking the event loop.
+
+    The upload is streamed in fixed-size chunks rather than read into one
+    bytes object, keeping peak memory per request at ~1 MiB regardless of
+    file size.
+
+    Args:
+        file: Uploaded file to spool to disk
+
+    Returns:
+        Path to the temporary file, or None if the upload has no filename,
+        an unsupported extension, or exceeds the size cap
+    """
+    if not file.filename:
+        return None
+
+    file_ext = Path(file.filename).suffix.lower()
+    if file_ext not in ALLOWED_IMAGE_EXTENSIONS:
+        return None
+
+    # Reject declared-oversize uploads before writing anything
+    if file.size and file.size > _MAX_UPLOAD_BYTES:
+        logger.warning(f"Rejecting oversized upload {file.filename}: {file.size} bytes")
+        return None
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
+        temp_file_path = temp_file.name
+
+    written = 0
+    async with aiofiles.open(temp_file_path, 'wb') as f:
+        while chunk := await file.read(_UPLOAD_CHUNK):
+            written += len(chunk)
+            if written > _MAX_UPLOAD_BYTES:
+                # Undeclared size: abort mid-stream once the cap is crossed
+                logger.warning(f"Rejecting oversized upload {file.filename}: exceeded {_MAX_UPLOAD_BYTES} bytes")
+                os.unlink(temp_file_path)
+                return None
+            await f.write(chunk)
+
+    return temp_file_path
+
+
+def _postprocess_result(result: dict,
+                        translator_engine: Optional[TextTranslator],
+                        target_language: str,
+                        context: bool,
+                        summarizer_engine: Optional[ContentProcessor]) -> tuple:
+    """
+    Run optional translation and summarization for a single OCR result.
+
+    Args:
+        result: OCR result dictionary containing extracted text
+        translator_engine: Translator to use, or None to skip translation
+        target_language: Target language code for translation
+        context: Whether to use contextual NLLB translation
+        summarizer_engine: Summarizer to use, or None to skip summarization
+
+    Returns:
+        Tuple of (translated_text, summarized_content), either may be None
+    """
+    translated_text = None
+    if translator_engine is not None and result['text'].strip():
+        try:
+            translated_text = translator_engine.translate_text(
+                result['text'],
+                target_language,
+                context=context
+            )
+        except Exception as e:
+            logger.warning(f"Translation failed for {result.get('image_path')}: {e}")
+
+    summarized_content = None
+    if summarizer_engine is not None and result['text'].strip():
+        try:
+            # Use translated text if available, otherwise original text
+            text_to_summarize = translated_text if translated_text else result['text']
+            summarized_content = summarizer_engine.summarize(text_to_summarize)
+        except Exception as e:
+            logger.warning(f"Summarization failed for {result.get('image_path')}: {e}")
+
+    return translated_text, summarized_content
+
+
+def _cleanup_files(file_paths: List[str]) -> None:
+    """
+    Remove temporary files, ignoring ones that are already gone.
+
+    Scheduled as a FastAPI background task so the unlink syscalls happen
+    after the response has been sent instead of on the request path.
+
+    Args:
+        file_paths: Paths of temporary files to delete
+    """
+    for file_path in file_paths:
+        try:
+            os.unlink(file_path)
+        except OSError:
+            pass
+
+# Initialize engines (lazy loading). Each singleton has its own lock so two
+# concurrent cold-start requests cannot both construct a multi-GB model.
 ocr_engine = None
 translator = None
 summarizer = None
+_ocr_engine_lock = threading.Lock()
+_translator_lock = threading.Lock()
+_summarizer_lock = threading.Lock()
 
 def get_ocr_engine() -> OCREngine:
-    """Get or create OCR engine instance."""
+    """Get or create OCR engine instance (thread-safe)."""
     global ocr_engine
     if ocr_engine is None:
-        try:
-            ocr_engine = OCREngine()
-            logger.info("OCR engine initialized for API")
-        except Exception as e:
-            logger.error(f"Failed to initialize OCR engine: {e}")
-            raise HTTPException(status_code=500, detail="OCR engine initialization failed")
+        with _ocr_engine_lock:
+            if ocr_engine is None:
+                try:
+                    ocr_engine = OCREngine()
+                    logger.info("OCR engine initialized for API")
+                except Exception as e:
+                    logger.error(f"Failed to initialize OCR engine: {e}")
+                    raise HTTPException(status_code=500, detail="OCR engine initialization failed")
     return ocr_engine
 
 def get_translator() -> TextTranslator:
-    """Get or create translator instance."""
+    """Get or create translator instance (thread-safe)."""
     global translator
     if translator is None:
-        try:
-            translator = TextTranslator()
-            logger.info("Translator initialized for API")
-        except Exception as e:
-            logger.error(f"Failed to initialize translator: {e}")
-            raise HTTPException(status_code=500, detail="Translator initialization failed")
+        with _translator_lock:
+            if translator is None:
+                try:
+                    translator = TextTranslator()
+                    logger.info("Translator initialized for API")
+                except Exception as e:
+                    logger.error(f"Failed to initialize translator: {e}")
+                    raise HTTPException(status_code=500, detail="Translator initialization failed")
     return translator
 
 def get_summarizer(model_size: str = "small") -> ContentProcessor:
-    """Get or create summarizer instance with specified model size."""
+    """Get or create summarizer instance with specified model size (thread-safe)."""
     global summarizer
     if summarizer is None or getattr(summarizer, 'model_size', None) != model_size:
-        try:
-            summarizer = ContentProcessor()
-            logger.info(f"Summarizer initialized for API with {model_size} model")
-        except Exception as e:
-            logger.error(f"Failed to initialize summarizer: {e}")
-            raise HTTPException(status_code=500, detail="Summarizer initialization failed")
+        with _summarizer_lock:
+            if summarizer is None or getattr(summarizer, 'model_size', None) != model_size:
+                try:
+                    summarizer = ContentProcessor()
+                    logger.info(f"Summarizer initialized for API with {model_size} model")
+                except Exception as e:
+                    logger.error(f"Failed to initialize summarizer: {e}")
+                    raise HTTPException(status_code=500, detail="Summarizer initialization failed")
     return summarizer
 
 
@@ -88,6 +248,7 @@ class BatchOCRResult(BaseModel):
 
 @router.post("/ocr/extract", response_model=OCRResult)
 async def extract_text_from_image(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     ocr_type: str = Form("handwritten", description="OCR type for processing (handwritten text)"),
     translate: bool = Form(False, description="Whether to translate the extracted text"),
@@ -111,76 +272,88 @@ async def extract_text_from_image(
         raise HTTPException(status_code=400, detail="No file provided")
 
     # Validate file extension
-    allowed_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'}
     file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_IMAGE_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
+            detail=f"Unsupported file type. Allowed: {', '.join(ALLOWED_IMAGE_EXTENSIONS)}"
         )
 
-    try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-
-        try:
-            # Process with OCR
-            engine = get_ocr_engine()
-            result = engine.extract_text(temp_file_path, ocr_type)
-
-            # Handle translation if requested
-            translated_text = None
-            if translate and result['text'].strip():
-                try:
-                    translator_engine = get_translator()
-                    translated_text = translator_engine.translate_text(
-                        result['text'],
-                        target_language,
-                        context=context
-                    )
-                    logger.info(f"Successfully translated text to {target_language}")
-                except Exception as e:
-                    logger.warning(f"Translation failed: {e}")
-                    # Continue without translation rather than failing the whole request
+    # Reject oversized uploads before any disk I/O
+    if file.size and file.size > _MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum allowed: {_MAX_UPLOAD_BYTES // (1024 * 1024)}MB"
+        )
 
-            # Handle summarization if requested
-            summarized_content = None
-            if summarize_content and result['text'].strip():
-                try:
-                    summarizer_engine = get_summarizer(summarizer_model)
-                    # Use translated text if available, otherwise original text
-                    text_to_summarize = translated_text if translated_text else result['text']
-                    summarized_content = summarizer_engine.summarize(text_to_summarize)
-                    logger.info("Successfully summarized content")
-                except Exception as e:
-                    logger.warning(f"Summarization failed: {e}")
-                    # Continue without summarization rather than failing the whole request
-
-            # Return result with optional translation and summarization
-            return OCRResult(
-                **result,
-                translated_text=translated_text,
-                target_language=target_language if translate else None,
-                summarized_content=summarized_content
+    temp_file_path = None
+    try:
+        # Stream uploaded file to a temporary path
+        temp_file_path = await _spool_upload(file)
+        if temp_file_path is None:
+            # Upload crossed the size cap mid-stream (undeclared size)
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum allowed: {_MAX_UPLOAD_BYTES // (1024 * 1024)}MB"
             )
 
-        finally:
-            # Clean up temporary file
+        # Process with OCR
+        engine = get_ocr_engine()
+        result = engine.extract_text(temp_file_path, ocr_type)
+
+        # Handle translation if requested
+        translated_text = None
+        if translate and result['text'].strip():
             try:
-                os.unlink(temp_file_path)
-            except OSError:
-                pass
+                translator_engine = get_translator()
+                translated_text = translator_engine.translate_text(
+                    result['text'],
+                    target_language,
+                    context=context
+                )
+                logger.info(f"Successfully translated text to {target_language}")
+            except Exception as e:
+                logger.warning(f"Translation failed: {e}")
+                # Continue without translation rather than failing the whole request
+
+        # Handle summarization if requested
+        summarized_content = None
+        if summarize_content and result['text'].strip():
+            try:
+                summarizer_engine = get_summarizer(summarizer_model)
+                # Use translated text if available, otherwise original text
+                text_to_summarize = translated_text if translated_text else result['text']
+                summarized_content = summarizer_engine.summarize(text_to_summarize)
+                logger.info("Successfully summarized content")
+            except Exception as e:
+                logger.warning(f"Summarization failed: {e}")
+                # Continue without summarization rather than failing the whole request
+
+        # Clean up after the response has been sent
+        background_tasks.add_task(_cleanup_files, [temp_file_path])
+
+        # Return result with optional translation and summarization
+        return OCRResult(
+            **result,
+            translated_text=translated_text,
+            target_language=target_language if translate else None,
+            summarized_content=summarized_content
+        )
 
+    except HTTPException:
+        if temp_file_path:
+            _cleanup_files([temp_file_path])
+        raise
     except Exception as e:
+        if temp_file_path:
+            _cleanup_files([temp_file_path])
         logger.error(f"OCR processing failed: {e}")
         raise HTTPException(status_code=500, detail=f"OCR processing failed: {str(e)}")
 
 
 @router.post("/ocr/extract/batch", response_model=BatchOCRResult)
 async def extract_text_from_images(
+    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
     ocr_type: str = Form("handwritten", description="OCR type for processing (handwritten text)"),
     translate: bool = Form(False, description="Whether to translate the extracted text"),
@@ -209,21 +382,9 @@ async def extract_text_from_images(
     temp_files = []
 
     try:
-        # Save all uploaded files temporarily
-        for file in files:
-            if not file.filename:
-                continue
-
-            file_ext = Path(file.filename).suffix.lower()
-            allowed_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif', '.webp'}
-
-            if file_ext not in allowed_extensions:
-                continue  # Skip invalid files
-
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-                content = await file.read()
-                temp_file.write(content)
-                temp_files.append(temp_file.name)
+        # Spool all uploads to disk concurrently; invalid files are skipped
+        spooled = await asyncio.gather(*(_spool_upload(file) for file in files))
+        temp_files = [path for path in spooled if path]
 
         if not temp_files:
             raise HTTPException(status_code=400, detail="No valid image files provided")
@@ -233,34 +394,25 @@ async def extract_text_from_images(
         results = engine.extract_text_batch(temp_files, ocr_type)
 
         # Handle translation and summarization if requested
-        if translate:
-            translator_engine = get_translator()
-        if summarize_content:
-            summarizer_engine = get_summarizer(summarizer_model)
+        translator_engine = get_translator() if translate else None
+        summarizer_engine = get_summarizer(summarizer_model) if summarize_content else None
+
+        # Fan per-image translation/summarization out across the pool
+        # instead of post-processing each result serially
+        loop = asyncio.get_running_loop()
+        post_tasks = [
+            loop.run_in_executor(
+                _POSTPROCESS_POOL, _postprocess_result,
+                result, translator_engine, target_language, context, summarizer_engine
+            ) if 'error' not in result else None
+            for result in results
+        ]
 
         # Convert to response model
         ocr_results = []
-        for result in results:
-            if 'error' not in result:
-                translated_text = None
-                if translate and result['text'].strip():
-                    try:
-                        translated_text = translator_engine.translate_text(
-                            result['text'],
-                            target_language,
-                            context=context
-                        )
-                    except Exception as e:
-                        logger.warning(f"Translation failed for {result.get('image_path')}: {e}")
-
-                summarized_content = None
-                if summarize_content and result['text'].strip():
-                    try:
-                        # Use translated text if available, otherwise original text
-                        text_to_summarize = translated_text if translated_text else result['text']
-                        summarized_content = summarizer_engine.summarize(text_to_summarize)
-                    except Exception as e:
-                        logger.warning(f"Summarization failed for {result.get('image_path')}: {e}")
+        for result, task in zip(results, post_tasks):
+            if task is not None:
+                translated_text, summarized_content = await task
 
                 ocr_results.append(OCRResult(
                     **result,
@@ -287,20 +439,16 @@ async def extract_text_from_images(
             failed=sum(1 for r in results if 'error' in r)
         )
 
+        # Clean up after the response has been sent
+        background_tasks.add_task(_cleanup_files, temp_files)
+
         return response
 
     except Exception as e:
+        _cleanup_files(temp_files)
         logger.error(f"Batch OCR processing failed: {e}")
         raise HTTPException(status_code=500, detail=f"Batch OCR processing failed: {str(e)}")
 
-    finally:
-        # Clean up temporary files
-        for temp_file in temp_files:
-            try:
-                os.unlink(temp_file)
-            except OSError:
-                pass
-
 
 @router.get("/ocr/models")
 async def get_available_models():
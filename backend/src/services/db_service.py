@@ -1,13 +1,30 @@
 
+import logging
 import os
 import mimetypes
+import mmap
+from functools import lru_cache
 from pathlib import Path
+import httpx
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Build the mimetypes tables once at import instead of lazily on the first
+# guess inside a request
+mimetypes.init()
+
+
+@lru_cache(maxsize=128)
+def _guess_mime_type(suffix: str) -> str:
+    """Return the mime type for a file suffix (e.g. '.mp4'), memoized."""
+    mime_type, _ = mimetypes.guess_type(f"f{suffix}")
+    return mime_type or "application/octet-stream"
+
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_ANON_KEY")
 
@@ -17,10 +34,33 @@ class DBService:
         if SUPABASE_URL and SUPABASE_KEY:
             try:
                 self.client = create_client(SUPABASE_URL, SUPABASE_KEY)
+                self._tune_http_client()
             except Exception as e:
-                print(f"⚠️ Failed to initialize Supabase client: {e}")
+                logger.error("Failed to initialize Supabase client: %s", e)
         else:
-            print("⚠️ Supabase credentials not found in env. DB/Storage features disabled.")
+            logger.warning("Supabase credentials not found in env. DB/Storage features disabled.")
+
+    def _tune_http_client(self):
+        """
+        Swap the storage client's transport for one with keep-alive (and
+        HTTP/2 when the h2 package is installed), so repeated uploads reuse
+        one TLS connection instead of handshaking per request.
+        """
+        try:
+            try:
+                http_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=10),
+                    timeout=60,
+                )
+            except ImportError:
+                http_client = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=10),
+                    timeout=60,
+                )
+            self.client.storage._client = http_client
+        except Exception as e:
+            logger.warning("Could not tune Supabase HTTP client, using defaults: %s", e)
 
     def upload_file(self, file_path: str, bucket_name: str = "processed_files") -> str:
         """
@@ -30,33 +70,44 @@ class DBService:
             return None
 
         path_obj = Path(file_path)
-        if not path_obj.exists():
+        # One stat covers both the existence check and the size used below
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
             return None
 
         file_name = path_obj.name
-        # Simple path strategy: just the filename. 
+        # Simple path strategy: just the filename.
         # For production, might want 'user_id/timestamp_filename' to avoid collisions.
-        storage_path = f"{file_name}" 
-        
+        storage_path = f"{file_name}"
+
         try:
-            # Guess mime type
-            mime_type, _ = mimetypes.guess_type(file_path)
-            if not mime_type:
-                mime_type = "application/octet-stream"
+            # Guess mime type (memoized per extension)
+            mime_type = _guess_mime_type(path_obj.suffix.lower())
 
+            # Memory-map the file so the kernel pages it into the request
+            # body on demand instead of copying the whole payload into RSS
             with open(file_path, 'rb') as f:
-                self.client.storage.from_(bucket_name).upload(
-                    file=f,
-                    path=storage_path,
-                    file_options={"content-type": mime_type, "upsert": "true"}
-                )
+                if file_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self.client.storage.from_(bucket_name).upload(
+                            file=mm,
+                            path=storage_path,
+                            file_options={"content-type": mime_type, "upsert": "true"}
+                        )
+                else:
+                    self.client.storage.from_(bucket_name).upload(
+                        file=f,
+                        path=storage_path,
+                        file_options={"content-type": mime_type, "upsert": "true"}
+                    )
             
             # Get public URL (optional, depending on if bucket is public)
             # stored_url = self.client.storage.from_(bucket_name).get_public_url(storage_path)
             return storage_path
 
         except Exception as e:
-            print(f"Error uploading file to Supabase: {e}")
+            logger.error("Error uploading file to Supabase: %s", e)
             return None
 
     def save_file_record(self, filename: str, storage_path: str, size_bytes: int, user_id: str = None):
@@ -79,7 +130,7 @@ class DBService:
             response = self.client.table("files").insert(data).execute()
             return response
         except Exception as e:
-            print(f"Error saving file record to Supabase: {e}")
+            logger.error("Error saving file record to Supabase: %s", e)
             return None
 
     def get_usage_metrics(self, user_id: str):
@@ -94,24 +145,47 @@ class DBService:
                 return response.data[0]
             return None
         except Exception as e:
-            print(f"Error fetching usage metrics: {e}")
+            logger.error("Error fetching usage metrics: %s", e)
             return None
 
     def update_usage_metrics(self, user_id: str, minutes_added: float, storage_added_bytes: int):
         """
-        Increment usage metrics for a user using an RPC call or direct update.
-        Here we fetch first then update for simplicity, though RPC 'increment' is better for concurrency.
+        Increment usage metrics for a user atomically via the
+        'increment_usage' Postgres function (single round-trip, no lost
+        updates under concurrency):
+
+            create function increment_usage(uid uuid, mins float, bytes bigint)
+            returns void as $$
+                insert into usage_metrics (user_id, minutes_processed, storage_used_bytes)
+                values (uid, mins, bytes)
+                on conflict (user_id) do update set
+                    minutes_processed = usage_metrics.minutes_processed + excluded.minutes_processed,
+                    storage_used_bytes = usage_metrics.storage_used_bytes + excluded.storage_used_bytes;
+            $$ language sql;
+
+        Falls back to the old fetch-then-update path when the function is
+        not deployed yet.
         """
         if not self.client:
             return None
+
+        logger.info("Updating usage for user: %s (+%s mins, +%s bytes)", user_id, minutes_added, storage_added_bytes)
+        try:
+            return self.client.rpc("increment_usage", {
+                "uid": user_id,
+                "mins": minutes_added,
+                "bytes": storage_added_bytes
+            }).execute()
+        except Exception as e:
+            logger.warning("increment_usage RPC failed (%s), falling back to fetch-then-update", e)
+
         try:
             # Fetch current
-            print(f"Updating usage for user: {user_id} (+{minutes_added} mins, +{storage_added_bytes} bytes)")
             current = self.get_usage_metrics(user_id)
-            
+
             if not current:
                 # Create if not exists (Upsert-ish logic)
-                print(f"Metrics not found for {user_id}. Creating new record.")
+                logger.info("Metrics not found for %s. Creating new record.", user_id)
                 self.client.table("usage_metrics").insert({
                     "user_id": user_id,
                     "minutes_processed": minutes_added,
@@ -129,7 +203,7 @@ class DBService:
             
             return response
         except Exception as e:
-            print(f"Error updating usage metrics: {e}")
+            logger.error("Error updating usage metrics: %s", e)
             return None
 
 # Singleton instance
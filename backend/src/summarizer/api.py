@@ -2,7 +2,9 @@
 FastAPI router for summarizer endpoints.
 """
 
+import asyncio
 import logging
+import threading
 from typing import Optional
 from pydantic import BaseModel
 
@@ -17,24 +19,57 @@ router = APIRouter(prefix="/summarizer", tags=["Summarizer"])
 
 # Global processor instance (lazy loaded)
 _processor = None
+_processor_lock = threading.Lock()
 
 
 def get_processor(model_size: str = "small") -> ContentProcessor:
-    """Get or create the global content processor instance with specified model size."""
+    """
+    Get or create the global content processor instance.
+
+    ContentProcessor always loads the same fixed model pair, so the instance
+    is a true singleton: it is created once and reused for every request
+    regardless of the requested model_size (kept for API compatibility).
+    Re-creating it per size cost seconds of model loading per request.
+    """
     global _processor
-    if _processor is None or getattr(_processor, 'model_size', None) != model_size:
-        try:
-            _processor = ContentProcessor()
-            logger.info(f"Initialized ContentProcessor for API with {model_size} model")
-        except Exception as e:
-            logger.error(f"Failed to initialize ContentProcessor: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Summarizer service initialization failed: {str(e)}"
-            )
+    if _processor is None:
+        with _processor_lock:
+            if _processor is None:
+                try:
+                    _processor = ContentProcessor()
+                    logger.info("Initialized ContentProcessor for API")
+                except Exception as e:
+                    logger.error(f"Failed to initialize ContentProcessor: {e}")
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Summarizer service initialization failed: {str(e)}"
+                    )
     return _processor
 
 
+@router.on_event("startup")
+async def warm_processor():
+    """
+    Construct and warm the processor at startup.
+
+    Loading the models and running one throwaway summarize/answer pass here
+    moves multi-second cold-start cost (weights from disk, CUDA context,
+    torch.compile caches) out of the first user request. Failures are
+    logged and deferred to lazy initialization rather than blocking boot.
+    """
+    def _warm():
+        processor = get_processor()
+        processor._load_model()
+        processor.summarize("warmup", max_length=45, summary_style="paragraph")
+        processor.answer_question("warmup?", "warmup", max_length=5)
+
+    try:
+        await asyncio.to_thread(_warm)
+        logger.info("Summarizer processor warmed up")
+    except Exception as e:
+        logger.warning(f"Summarizer warmup failed (will load lazily): {e}")
+
+
 class QnARequest(BaseModel):
     """Request model for Q&A."""
     question: str
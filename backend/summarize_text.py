@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """
-Command-line script to summarize text from a file (text or JSON).
+Command-line script to summarize text from files (text or JSON).
 
 Usage:
     python summarize_text.py /path/to/text/file.txt [--output summary.txt]
     python summarize_text.py input.json --field text --output output.json
+    python summarize_text.py docs/*.txt --workers 4 --output summaries/
 
 This script will:
-1. Read text from the input file (plain text or JSON)
+1. Read text from the input file(s) (plain text or JSON)
 2. Summarize the text using mT5-XLSum
 3. Save the summary to a file or print to stdout
 """
@@ -30,10 +31,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-worker processor for the multi-process path; initialized once per
+# worker so each process pays model-load cost a single time
+_worker_processor = None
+
+
+def _init_worker():
+    """Load one ContentProcessor in each worker process."""
+    global _worker_processor
+    _worker_processor = ContentProcessor()
+
+
+def _summarize_in_worker(job):
+    """Summarize one document using the worker's processor."""
+    text, max_length, style = job
+    return _worker_processor.summarize(text, max_length=max_length, summary_style=style)
+
+
+def _read_text(input_file: Path, field):
+    """Read the text to summarize from a plain-text or JSON file."""
+    is_json = input_file.suffix.lower() == '.json'
+
+    if is_json or field:
+        # Handle JSON file
+        if not field:
+            logger.error("--field is required when processing JSON files")
+            sys.exit(1)
+
+        logger.info(f"Reading JSON from: {input_file}")
+        with open(input_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if field not in data:
+            logger.error(f"Field '{field}' not found in JSON file")
+            sys.exit(1)
+
+        text = str(data[field]).strip()
+        logger.info(f"Extracted text from field '{field}' (length: {len(text)} characters)")
+    else:
+        # Handle plain text file
+        logger.info(f"Reading text from: {input_file}")
+        with open(input_file, 'r', encoding='utf-8') as f:
+            text = f.read().strip()
+
+    if not text:
+        logger.error(f"Input text is empty: {input_file}")
+        sys.exit(1)
+
+    return text
+
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Summarize text from a file (text or JSON) using mT5",
+        description="Summarize text from files (text or JSON) using mT5",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -46,14 +96,15 @@ Examples:
     # Specify max length and style
     python summarize_text.py document.txt --max-length 200 --style bullet_points
 
-    # JSON with custom field and paragraph style
-    python summarize_text.py data.json --field content --output summary.json --style paragraph
+    # Several files at once; summaries land in the output directory
+    python summarize_text.py docs/*.txt --workers 4 --output summaries/
         """
     )
 
     parser.add_argument(
         'file_path',
-        help='Path to the text or JSON file to summarize'
+        nargs='+',
+        help='Path(s) to the text or JSON file(s) to summarize'
     )
 
     parser.add_argument(
@@ -63,9 +114,18 @@ Examples:
 
     parser.add_argument(
         '--output', '-o',
-        help='Output file path (optional, prints to stdout if not specified)'
+        help='Output file path for a single input, or output directory for '
+             'several inputs (optional, prints to stdout if not specified)'
     )
 
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes for several input files; each worker loads '
+             'its own model, so this mainly helps on CPU (default: 1, which '
+             'batches all documents through one model instead)'
+    )
 
     parser.add_argument(
         '--max-length',
@@ -93,73 +153,68 @@ Examples:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Validate input file
-    input_file = Path(args.file_path)
-    if not input_file.exists():
-        logger.error(f"Input file not found: {input_file}")
-        sys.exit(1)
-
-    if not input_file.is_file():
-        logger.error(f"Path is not a file: {input_file}")
-        sys.exit(1)
-
-    try:
-        # Determine if file is JSON based on extension or content
-        is_json = input_file.suffix.lower() == '.json'
-
-        if is_json or args.field:
-            # Handle JSON file
-            if not args.field:
-                logger.error("--field is required when processing JSON files")
-                sys.exit(1)
-
-            logger.info(f"Reading JSON from: {input_file}")
-            with open(input_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            if args.field not in data:
-                logger.error(f"Field '{args.field}' not found in JSON file")
-                sys.exit(1)
-
-            text = str(data[args.field]).strip()
-            logger.info(f"Extracted text from field '{args.field}' (length: {len(text)} characters)")
-        else:
-            # Handle plain text file
-            logger.info(f"Reading text from: {input_file}")
-            with open(input_file, 'r', encoding='utf-8') as f:
-                text = f.read().strip()
-
-        if not text:
-            logger.error("Input text is empty")
+    # Validate input files
+    input_files = [Path(p) for p in args.file_path]
+    for input_file in input_files:
+        if not input_file.exists():
+            logger.error(f"Input file not found: {input_file}")
+            sys.exit(1)
+        if not input_file.is_file():
+            logger.error(f"Path is not a file: {input_file}")
             sys.exit(1)
 
-        # Initialize summarizer
-        logger.info("Initializing ContentProcessor...")
-        summarizer = ContentProcessor()
+    try:
+        texts = [_read_text(input_file, args.field) for input_file in input_files]
 
-        # Perform summarization
         logger.info("Starting text summarization...")
-        summary = summarizer.summarize(text, max_length=args.max_length, summary_style=args.style)
+        if args.workers > 1 and len(input_files) > 1:
+            # One model per worker process; N files finish in ~N/workers
+            # of the sequential time on CPU
+            from concurrent.futures import ProcessPoolExecutor
+
+            jobs = [(text, args.max_length, args.style) for text in texts]
+            with ProcessPoolExecutor(max_workers=args.workers,
+                                     initializer=_init_worker) as pool:
+                summaries = list(pool.map(_summarize_in_worker, jobs))
+        else:
+            # Load the model once and batch every document through it
+            logger.info("Initializing ContentProcessor...")
+            summarizer = ContentProcessor()
+            summaries = summarizer.summarize_batch(
+                texts, max_length=args.max_length, summary_style=args.style)
 
-        if summary is None:
+        if any(summary is None for summary in summaries):
             logger.error("Summarization failed")
             sys.exit(1)
 
         # Prepare output data
-        output_data = {
-            "original_text": text,
-            "summarized_text": summary
-        }
+        results = [
+            {"original_text": text, "summarized_text": summary}
+            for text, summary in zip(texts, summaries)
+        ]
 
-        # Output result
+        # Output results
         if args.output:
             output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Summary saved to: {output_path}")
+            if len(input_files) > 1:
+                output_path.mkdir(parents=True, exist_ok=True)
+                for input_file, result in zip(input_files, results):
+                    summary_file = output_path / f"{input_file.stem}_summary.json"
+                    with open(summary_file, 'w', encoding='utf-8') as f:
+                        json.dump(result, f, indent=2, ensure_ascii=False)
+                    logger.info(f"Summary saved to: {summary_file}")
+            else:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(results[0], f, indent=2, ensure_ascii=False)
+                logger.info(f"Summary saved to: {output_path}")
         else:
-            print(json.dumps(output_data, indent=2, ensure_ascii=False))
+            if len(results) == 1:
+                print(json.dumps(results[0], indent=2, ensure_ascii=False))
+            else:
+                print(json.dumps(
+                    {str(f): result for f, result in zip(input_files, results)},
+                    indent=2, ensure_ascii=False))
 
         logger.info("✅ Text summarization completed successfully!")
 
@@ -176,4 +231,4 @@ Examples:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for the backend test suite.
+"""
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(scope="session")
+def shared_transcriber():
+    """
+    One AudioTranscriber shared across the whole session.
+
+    Re-running __init__ (torch/cuda probing, logger setup) per test adds
+    nothing when WhisperX is mocked anyway; construction-specific tests
+    keep building their own instances. Imported lazily so collecting
+    non-ASR test modules does not require torch.
+    """
+    from src.asr.core import AudioTranscriber
+
+    with patch('src.asr.core.whisperx'), \
+            patch('src.asr.core.torch.cuda.is_available', return_value=False):
+        yield AudioTranscriber()
@@ -8,9 +8,9 @@ from fastapi.testclient import TestClient
 from src.api import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI app."""
+    """One TestClient for the whole module; app startup is paid once."""
     return TestClient(app)
 
 
@@ -52,8 +52,6 @@ def test_health_check_endpoint(client):
 
 def test_app_initialization():
     """Test that the FastAPI app is properly initialized with routers and static files."""
-    from src.api import app
-
     # Check that routers are included
     router_count = len(app.routes)
     # Should have at least the root route, health route, and 3 router prefixes
@@ -64,59 +62,38 @@ def test_app_initialization():
     assert mount_count >= 2  # /files and /downloads
 
 
-def test_services_structure_in_root_response(client):
-    """Test that the services structure in root response is correct."""
-    response = client.get("/")
-    data = response.json()
-
-    services = data["services"]
-
-    # Check current services
-    current_services = services["current"]
-    assert "downloader" in current_services
-    assert "converter" in current_services
-    assert "asr" in current_services
-
-    # Check planned services
-    planned_services = services["planned"]
-    assert "translator" in planned_services
-    assert "chat" in planned_services
-    assert "editor" in planned_services
-
-
-def test_documentation_links_in_root_response(client):
-    """Test that documentation links are provided in root response."""
-    response = client.get("/")
-    data = response.json()
-
-    docs = data["documentation"]
-    assert docs["interactive"] == "/docs"
-    assert docs["reference"] == "/redoc"
-    assert docs["schema"] == "/openapi.json"
-
-
-def test_features_in_root_response(client):
-    """Test that features are listed in root response."""
-    response = client.get("/")
-    data = response.json()
-
-    features = data["features"]
-    assert features["file_access"] == "/files"
-    assert features["health_check"] == "/health"
-    assert features["background_processing"] is True
-    assert features["microservices"] is True
-
-
-def test_usage_examples_in_root_response(client):
-    """Test that usage examples are provided in root response."""
+@pytest.mark.parametrize("section, expected", [
+    ("services", {
+        "current": ["downloader", "converter", "asr"],
+        "planned": ["translator", "chat", "editor"],
+    }),
+    ("documentation", {
+        "interactive": "/docs",
+        "reference": "/redoc",
+        "schema": "/openapi.json",
+    }),
+    ("features", {
+        "file_access": "/files",
+        "health_check": "/health",
+        "background_processing": True,
+        "microservices": True,
+    }),
+    ("usage", {
+        "unified_server": "python main.py --api",
+        "converter_server": "python main.py --converter-api",
+    }),
+])
+def test_root_response_sections(client, section, expected):
+    """Test each structured section of the root response against a table."""
     response = client.get("/")
-    data = response.json()
-
-    usage = data["usage"]
-    assert "unified_server" in usage
-    assert "converter_server" in usage
-    assert usage["unified_server"] == "python main.py --api"
-    assert usage["converter_server"] == "python main.py --converter-api"
+    payload = response.json()[section]
+
+    for key, value in expected.items():
+        if isinstance(value, list):
+            for item in value:
+                assert item in payload[key]
+        else:
+            assert payload[key] == value
 
 
 def test_openapi_schema_available(client):
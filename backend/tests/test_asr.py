@@ -2,115 +2,130 @@
 Tests for ASR functionality.
 """
 import pytest
-import tempfile
-from pathlib import Path
+import struct
 from unittest.mock import patch, MagicMock
 
-from src.asr.core import AudioTranscriber
 from src.asr.models import TranscriptionResult, WordTimestamp
 
 
+def _make_align_result(text, words):
+    """Build one whisperx.align-shaped result dict from plain word tuples."""
+    return {
+        "text": text,
+        "language": "en",
+        "segments": [
+            {
+                "text": text,
+                "start": words[0][1],
+                "end": words[-1][2],
+                "words": [
+                    {"word": word, "start": start, "end": end, "score": score}
+                    for word, start, end, score in words
+                ],
+            }
+        ],
+    }
+
+
+# Align fixtures built once at import; plain dicts are cheaper than the
+# per-test literal rebuilds they replace
+_DEFAULT_ALIGN_RESULT = _make_align_result("This is a test transcription.", [
+    ("This", 0.0, 0.5, 0.9),
+    ("is", 0.5, 0.8, 0.95),
+    ("a", 0.8, 1.0, 0.85),
+    ("test", 1.0, 1.5, 0.92),
+    ("transcription", 1.5, 3.0, 0.88),
+])
+
+_AUDIO_ALIGN_RESULT = _make_align_result("Hello world", [
+    ("Hello", 0.0, 1.0, 0.9),
+    ("world", 1.0, 2.0, 0.95),
+])
+
+_VIDEO_ALIGN_RESULT = _make_align_result("Video transcription test", [
+    ("Video", 0.0, 1.0, 0.9),
+    ("transcription", 1.0, 2.0, 0.95),
+    ("test", 2.0, 3.0, 0.88),
+])
+
+
 @pytest.fixture
-def temp_audio_file(tmp_path):
-    """Create a temporary audio file for testing."""
-    audio_file = tmp_path / "test.wav"
-    # Create a minimal WAV file header (44 bytes)
-    wav_header = b'RIFF\x24\x08\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x80>\x00\x00\x00}\x00\x00\x02\x00\x10\x00data\x00\x08\x00\x00'
-    audio_file.write_bytes(wav_header + b'\x00\x01\x02\x03\x04\x05\x06\x07')  # Add some dummy audio data
+def AudioTranscriber():
+    """Import the transcriber lazily so model-only tests never load torch."""
+    from src.asr.core import AudioTranscriber
+    return AudioTranscriber
+
+
+# Minimal 44-byte WAV header built once at import: RIFF size, PCM fmt
+# chunk (mono, 16 kHz, 16-bit samples), and the data chunk length
+_WAV_HEADER = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0x824, b'WAVE',
+    b'fmt ', 16, 1, 1, 16000, 32000, 2, 16,
+    b'data', 0x800,
+)
+
+
+@pytest.fixture(scope="session")
+def temp_audio_file(tmp_path_factory):
+    """Write the test WAV file once for the whole session."""
+    audio_file = tmp_path_factory.mktemp("asr") / "test.wav"
+    audio_file.write_bytes(_WAV_HEADER + bytes(8))  # header plus dummy audio data
     return str(audio_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_whisperx():
-    """Mock WhisperX to avoid actual model loading."""
-    with patch('src.asr.core.whisperx') as mock_whisperx:
-        # Mock the load_audio function
-        mock_whisperx.load_audio.return_value = MagicMock()
-
-        # Mock the load_model function
-        mock_model = MagicMock()
-        mock_whisperx.load_model.return_value = mock_model
-
-        # Mock the load_align_model function
-        mock_align_model = MagicMock()
-        mock_metadata = MagicMock()
-        mock_whisperx.load_align_model.return_value = (mock_align_model, mock_metadata)
-
-        # Mock the align function
-        mock_whisperx.align.return_value = {
-            "text": "This is a test transcription.",
-            "language": "en",
-            "segments": [
-                {
-                    "text": "This is a test transcription.",
-                    "start": 0.0,
-                    "end": 3.0,
-                    "words": [
-                        {"word": "This", "start": 0.0, "end": 0.5, "score": 0.9},
-                        {"word": "is", "start": 0.5, "end": 0.8, "score": 0.95},
-                        {"word": "a", "start": 0.8, "end": 1.0, "score": 0.85},
-                        {"word": "test", "start": 1.0, "end": 1.5, "score": 0.92},
-                        {"word": "transcription", "start": 1.5, "end": 3.0, "score": 0.88}
-                    ]
-                }
-            ]
-        }
-
-        yield mock_whisperx
+    """Mock WhisperX built once per module instead of per test."""
+    mock_whisperx = MagicMock()
+
+    # Mock the load_audio function
+    mock_whisperx.load_audio.return_value = MagicMock()
+
+    # Mock the load_model function
+    mock_whisperx.load_model.return_value = MagicMock()
+
+    # Mock the load_align_model function
+    mock_whisperx.load_align_model.return_value = (MagicMock(), MagicMock())
+
+    # Mock the align function
+    mock_whisperx.align.return_value = _DEFAULT_ALIGN_RESULT
+
+    return mock_whisperx
 
 
 class TestAudioTranscriber:
     """Test suite for AudioTranscriber class."""
 
-    def test_initialization(self):
+    @pytest.fixture(autouse=True)
+    def _patch_whisperx(self, mock_whisperx, monkeypatch):
+        """Point src.asr.core at the shared mock for every test in this class."""
+        monkeypatch.setattr('src.asr.core.whisperx', mock_whisperx)
+
+    def test_initialization(self, AudioTranscriber):
         """Test AudioTranscriber initialization."""
         with patch('src.asr.core.torch.cuda.is_available', return_value=True):
             transcriber = AudioTranscriber()
             assert transcriber.device == "cuda"
             assert transcriber.compute_type == "float16"
 
-    def test_initialization_cpu_fallback(self):
+    def test_initialization_cpu_fallback(self, AudioTranscriber):
         """Test AudioTranscriber initialization with CPU fallback."""
         with patch('src.asr.core.torch.cuda.is_available', return_value=False):
             transcriber = AudioTranscriber()
             assert transcriber.device == "cpu"
 
-    def test_initialization_custom_device(self):
+    def test_initialization_custom_device(self, AudioTranscriber):
         """Test AudioTranscriber initialization with custom device."""
         transcriber = AudioTranscriber(device="cpu", compute_type="float32")
         assert transcriber.device == "cpu"
         assert transcriber.compute_type == "float32"
 
-    @patch('src.asr.core.whisperx')
-    def test_transcribe_audio_success(self, mock_whisperx, temp_audio_file):
+    def test_transcribe_audio_success(self, mock_whisperx, temp_audio_file, shared_transcriber):
         """Test successful audio transcription."""
-        # Setup mocks
-        mock_model = MagicMock()
-        mock_whisperx.load_model.return_value = mock_model
-        mock_whisperx.load_audio.return_value = MagicMock()
-
-        mock_align_model = MagicMock()
-        mock_metadata = MagicMock()
-        mock_whisperx.load_align_model.return_value = (mock_align_model, mock_metadata)
-
-        mock_whisperx.align.return_value = {
-            "text": "Hello world",
-            "language": "en",
-            "segments": [
-                {
-                    "text": "Hello world",
-                    "start": 0.0,
-                    "end": 2.0,
-                    "words": [
-                        {"word": "Hello", "start": 0.0, "end": 1.0, "score": 0.9},
-                        {"word": "world", "start": 1.0, "end": 2.0, "score": 0.95}
-                    ]
-                }
-            ]
-        }
+        mock_whisperx.align.return_value = _AUDIO_ALIGN_RESULT
 
-        transcriber = AudioTranscriber()
-        result = transcriber.transcribe_audio(temp_audio_file)
+        result = shared_transcriber.transcribe_audio(temp_audio_file)
 
         assert isinstance(result, TranscriptionResult)
         assert result.text == "Hello world"
@@ -119,16 +134,15 @@ class TestAudioTranscriber:
         assert len(result.segments[0].words) == 2
         assert result.processing_time > 0
 
-    def test_transcribe_audio_file_not_found(self):
+    def test_transcribe_audio_file_not_found(self, AudioTranscriber):
         """Test transcription with non-existent file."""
         transcriber = AudioTranscriber()
 
         with pytest.raises(FileNotFoundError):
             transcriber.transcribe_audio("nonexistent.wav")
 
-    @patch('src.asr.core.whisperx')
     @patch('src.converter.video.VideoConverter')
-    def test_transcribe_video_success(self, mock_video_converter, mock_whisperx, tmp_path):
+    def test_transcribe_video_success(self, mock_video_converter, tmp_path, shared_transcriber, mock_whisperx):
         """Test successful video transcription."""
         # Create a dummy video file
         video_file = tmp_path / "test.mp4"
@@ -141,53 +155,26 @@ class TestAudioTranscriber:
         temp_audio_path.write_bytes(b'dummy audio content')
         mock_converter_instance.extract_audio_from_video.return_value = str(temp_audio_path)
 
-        # Setup mocks similar to audio test
-        mock_model = MagicMock()
-        mock_whisperx.load_model.return_value = mock_model
-        mock_whisperx.load_audio.return_value = MagicMock()
-
-        mock_align_model = MagicMock()
-        mock_metadata = MagicMock()
-        mock_whisperx.load_align_model.return_value = (mock_align_model, mock_metadata)
-
-        mock_whisperx.align.return_value = {
-            "text": "Video transcription test",
-            "language": "en",
-            "segments": [
-                {
-                    "text": "Video transcription test",
-                    "start": 0.0,
-                    "end": 3.0,
-                    "words": [
-                        {"word": "Video", "start": 0.0, "end": 1.0, "score": 0.9},
-                        {"word": "transcription", "start": 1.0, "end": 2.0, "score": 0.95},
-                        {"word": "test", "start": 2.0, "end": 3.0, "score": 0.88}
-                    ]
-                }
-            ]
-        }
+        mock_whisperx.align.return_value = _VIDEO_ALIGN_RESULT
 
-        transcriber = AudioTranscriber()
-        result = transcriber.transcribe_video(str(video_file))
+        result = shared_transcriber.transcribe_video(str(video_file))
 
         assert isinstance(result, TranscriptionResult)
         assert "Video transcription test" in result.text
         assert result.language == "en"
         assert len(result.segments) == 1
 
-    def test_get_supported_languages(self):
+    def test_get_supported_languages(self, shared_transcriber):
         """Test getting supported languages."""
-        transcriber = AudioTranscriber()
-        languages = transcriber.get_supported_languages()
+        languages = shared_transcriber.get_supported_languages()
 
         assert isinstance(languages, list)
         assert len(languages) > 0
         assert "en" in languages
 
-    def test_get_model_sizes(self):
+    def test_get_model_sizes(self, shared_transcriber):
         """Test getting available model sizes."""
-        transcriber = AudioTranscriber()
-        models = transcriber.get_model_sizes()
+        models = shared_transcriber.get_model_sizes()
 
         assert isinstance(models, list)
         assert "base" in models
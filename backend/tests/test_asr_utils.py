@@ -4,6 +4,7 @@ Tests for src/asr/utils.py utility functions.
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
+import stat
 import tempfile
 import os
 
@@ -12,6 +13,7 @@ from src.asr.utils import (
     validate_video_file,
     get_audio_duration,
     format_timestamp,
+    format_timestamps,
     estimate_transcription_time,
     cleanup_temp_files
 )
@@ -20,37 +22,30 @@ from src.asr.utils import (
 class TestValidateAudioFile:
     """Test validate_audio_file function."""
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    def test_validate_audio_file_not_exists(self, mock_is_file, mock_exists):
+    @patch('src.asr.utils.os.stat')
+    def test_validate_audio_file_not_exists(self, mock_stat):
         """Test validation of non-existent audio file."""
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError()
 
         is_valid, error = validate_audio_file("/nonexistent/audio.wav")
 
         assert not is_valid
         assert "File does not exist" in error
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    def test_validate_audio_file_not_file(self, mock_is_file, mock_exists):
+    @patch('src.asr.utils.os.stat')
+    def test_validate_audio_file_not_file(self, mock_stat):
         """Test validation when path is not a file."""
-        mock_exists.return_value = True
-        mock_is_file.return_value = False
+        mock_stat.return_value = MagicMock(st_mode=stat.S_IFDIR | 0o755)
 
         is_valid, error = validate_audio_file("/path/to/directory")
 
         assert not is_valid
         assert "Path is not a file" in error
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('pathlib.Path.suffix')
-    def test_validate_audio_file_unsupported_format(self, mock_suffix, mock_is_file, mock_exists):
+    @patch('src.asr.utils.os.stat')
+    def test_validate_audio_file_unsupported_format(self, mock_stat):
         """Test validation of unsupported audio format."""
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        mock_suffix.return_value = ".xyz"
+        mock_stat.return_value = MagicMock(st_mode=stat.S_IFREG | 0o644, st_size=1024)
 
         is_valid, error = validate_audio_file("audio.xyz")
 
@@ -65,25 +60,20 @@ class TestValidateAudioFile:
 class TestValidateVideoFile:
     """Test validate_video_file function."""
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    def test_validate_video_file_not_exists(self, mock_is_file, mock_exists):
+    @patch('src.asr.utils.os.stat')
+    def test_validate_video_file_not_exists(self, mock_stat):
         """Test validation of non-existent video file."""
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError()
 
         is_valid, error = validate_video_file("/nonexistent/video.mp4")
 
         assert not is_valid
         assert "File does not exist" in error
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.is_file')
-    @patch('pathlib.Path.suffix')
-    def test_validate_video_file_unsupported_format(self, mock_suffix, mock_is_file, mock_exists):
+    @patch('src.asr.utils.os.stat')
+    def test_validate_video_file_unsupported_format(self, mock_stat):
         """Test validation of unsupported video format."""
-        mock_exists.return_value = True
-        mock_is_file.return_value = True
-        mock_suffix.return_value = ".xyz"
+        mock_stat.return_value = MagicMock(st_mode=stat.S_IFREG | 0o644, st_size=1024)
 
         is_valid, error = validate_video_file("video.xyz")
 
@@ -98,7 +88,13 @@ class TestValidateVideoFile:
 class TestGetAudioDuration:
     """Test get_audio_duration function."""
 
-    @patch('subprocess.run')
+    @pytest.fixture(autouse=True)
+    def mock_subprocess_run(self, monkeypatch):
+        """One subprocess.run mock for the class; no per-test @patch stack."""
+        mock_run = MagicMock()
+        monkeypatch.setattr('subprocess.run', mock_run)
+        return mock_run
+
     def test_get_audio_duration_success(self, mock_subprocess_run):
         """Test successful audio duration retrieval."""
         mock_result = MagicMock()
@@ -111,7 +107,6 @@ class TestGetAudioDuration:
         assert duration == 123.45
         mock_subprocess_run.assert_called_once()
 
-    @patch('subprocess.run')
     def test_get_audio_duration_subprocess_failure(self, mock_subprocess_run):
         """Test audio duration retrieval when subprocess fails."""
         mock_result = MagicMock()
@@ -122,7 +117,6 @@ class TestGetAudioDuration:
 
         assert duration is None
 
-    @patch('subprocess.run')
     def test_get_audio_duration_invalid_json(self, mock_subprocess_run):
         """Test audio duration retrieval with invalid JSON."""
         mock_result = MagicMock()
@@ -134,7 +128,6 @@ class TestGetAudioDuration:
 
         assert duration is None
 
-    @patch('subprocess.run')
     def test_get_audio_duration_missing_duration(self, mock_subprocess_run):
         """Test audio duration retrieval when duration key is missing."""
         mock_result = MagicMock()
@@ -146,6 +139,18 @@ class TestGetAudioDuration:
 
         assert duration is None
 
+    def test_get_audio_duration_cached_repeat_probe(self, mock_subprocess_run, tmp_path):
+        """Test that re-probing an unchanged file skips ffprobe."""
+        audio_file = tmp_path / "cached.wav"
+        audio_file.write_bytes(b"x")
+        mock_subprocess_run.return_value = MagicMock(
+            returncode=0, stdout='{"format": {"duration": "12.5"}}')
+
+        assert get_audio_duration(str(audio_file)) == 12.5
+        assert get_audio_duration(str(audio_file)) == 12.5
+
+        mock_subprocess_run.assert_called_once()
+
     # Removed failing test: test_get_audio_duration_timeout
 
 
@@ -177,45 +182,27 @@ class TestFormatTimestamp:
         result = format_timestamp(7265.75)
         assert result == "02:01:05.75"
 
+    def test_format_timestamps_matches_scalar(self):
+        """Test that the batch formatter agrees with the scalar one."""
+        values = [i * 0.7265 for i in range(10_000)]
 
-class TestEstimateTranscriptionTime:
-    """Test estimate_transcription_time function."""
-
-    def test_estimate_transcription_time_tiny_model(self):
-        """Test transcription time estimation for tiny model."""
-        result = estimate_transcription_time(60.0, "tiny")
-        expected = 60.0 * 0.3 + 10.0  # 18 + 10 = 28
-        assert result == expected
-
-    def test_estimate_transcription_time_base_model(self):
-        """Test transcription time estimation for base model."""
-        result = estimate_transcription_time(60.0, "base")
-        expected = 60.0 * 0.5 + 10.0  # 30 + 10 = 40
-        assert result == expected
-
-    def test_estimate_transcription_time_small_model(self):
-        """Test transcription time estimation for small model."""
-        result = estimate_transcription_time(60.0, "small")
-        expected = 60.0 * 0.8 + 10.0  # 48 + 10 = 58
-        assert result == expected
+        assert format_timestamps(values) == [format_timestamp(v) for v in values]
 
-    def test_estimate_transcription_time_medium_model(self):
-        """Test transcription time estimation for medium model."""
-        result = estimate_transcription_time(60.0, "medium")
-        expected = 60.0 * 1.2 + 10.0  # 72 + 10 = 82
-        assert result == expected
 
-    def test_estimate_transcription_time_large_model(self):
-        """Test transcription time estimation for large model."""
-        result = estimate_transcription_time(60.0, "large")
-        expected = 60.0 * 2.0 + 10.0  # 120 + 10 = 130
-        assert result == expected
+class TestEstimateTranscriptionTime:
+    """Test estimate_transcription_time function."""
 
-    def test_estimate_transcription_time_unknown_model(self):
-        """Test transcription time estimation for unknown model."""
-        result = estimate_transcription_time(60.0, "unknown")
-        expected = 60.0 * 1.0 + 10.0  # 60 + 10 = 70
-        assert result == expected
+    @pytest.mark.parametrize("model, factor", [
+        ("tiny", 0.3),
+        ("base", 0.5),
+        ("small", 0.8),
+        ("medium", 1.2),
+        ("large", 2.0),
+        ("unknown", 1.0),  # unrecognized sizes fall back to 1.0x
+    ])
+    def test_estimate_transcription_time_model_factor(self, model, factor):
+        """Test transcription time estimation across model sizes."""
+        assert estimate_transcription_time(60.0, model) == 60.0 * factor + 10.0
 
     def test_estimate_transcription_time_different_duration(self):
         """Test transcription time estimation with different audio duration."""
@@ -227,47 +214,42 @@ class TestEstimateTranscriptionTime:
 class TestCleanupTempFiles:
     """Test cleanup_temp_files function."""
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.unlink')
-    def test_cleanup_temp_files_existing(self, mock_unlink, mock_exists):
+    @patch('src.asr.utils.os.unlink')
+    def test_cleanup_temp_files_existing(self, mock_unlink):
         """Test cleanup of existing temporary files."""
-        mock_exists.return_value = True
-
         cleanup_temp_files("temp1.wav", "temp2.mp3")
 
         assert mock_unlink.call_count == 2
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.unlink')
-    def test_cleanup_temp_files_nonexistent(self, mock_unlink, mock_exists):
+    @patch('src.asr.utils.os.unlink')
+    def test_cleanup_temp_files_nonexistent(self, mock_unlink):
         """Test cleanup when files don't exist."""
-        mock_exists.return_value = False
+        mock_unlink.side_effect = FileNotFoundError()
 
+        # Should not raise exception
         cleanup_temp_files("nonexistent.wav")
 
-        mock_unlink.assert_not_called()
+        mock_unlink.assert_called_once()
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.unlink')
-    def test_cleanup_temp_files_unlink_failure(self, mock_unlink, mock_exists):
+    @patch('src.asr.utils.os.unlink')
+    def test_cleanup_temp_files_unlink_failure(self, mock_unlink):
         """Test cleanup when unlink operation fails."""
-        mock_exists.return_value = True
-        mock_unlink.side_effect = Exception("Permission denied")
+        mock_unlink.side_effect = OSError("Permission denied")
 
         # Should not raise exception
         cleanup_temp_files("temp.wav")
 
         mock_unlink.assert_called_once()
 
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.unlink')
-    def test_cleanup_temp_files_multiple_files(self, mock_unlink, mock_exists):
+    @patch('src.asr.utils.os.unlink')
+    def test_cleanup_temp_files_multiple_files(self, mock_unlink):
         """Test cleanup of multiple files with mixed existence."""
-        mock_exists.side_effect = [True, False, True]
+        mock_unlink.side_effect = [None, FileNotFoundError(), None]
 
         cleanup_temp_files("exists1.wav", "notexists.wav", "exists2.mp3")
 
-        assert mock_unlink.call_count == 2
+        # Every path gets an unlink attempt under EAFP
+        assert mock_unlink.call_count == 3
 
     def test_cleanup_temp_files_no_files(self):
         """Test cleanup with no files provided."""
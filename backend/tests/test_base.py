@@ -32,6 +32,9 @@ def test_base_context_manager(base_downloader):
 
 
 def test_base_progress_hook(base_downloader, capsys):
+    # The bar is disabled on non-TTY stderr; force-enable it under capture
+    base_downloader._interactive = True
+
     # Simulate downloading status
     base_downloader.progress_hook({
         "status": "downloading",
@@ -3,8 +3,9 @@ Tests for convert_video.py script.
 """
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 # Add project root to sys.path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -12,21 +13,49 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from convert_video import main
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_convert_format(mock_path_class, mock_video_converter_class, monkeypatch, capsys):
+class FakePath(SimpleNamespace):
+    """Plain-attribute stand-in for pathlib.Path inside main().
+
+    Only the members the script touches exist; unlike a MagicMock there
+    is no lazily-allocated child-mock tree, just a namespace. Tests
+    override stem/suffix/st_size per case.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(stem="test", suffix=".mp4", st_size=1024 * 1024, **kwargs)
+
+    def exists(self):
+        return True
+
+    def stat(self):
+        return SimpleNamespace(st_size=self.st_size)
+
+
+@pytest.fixture
+def mock_input_path():
+    """Canonical input path; tests override only the fields they vary."""
+    return FakePath()
+
+
+@pytest.fixture
+def patched_path(mock_input_path, monkeypatch):
+    """Install mock_input_path as the result of every Path() call."""
+    monkeypatch.setattr("convert_video.Path", lambda p: mock_input_path)
+    return mock_input_path
+
+
+@pytest.fixture
+def mock_converter(monkeypatch):
+    """Install a mocked VideoConverter and return the instance."""
+    converter = MagicMock()
+    monkeypatch.setattr("convert_video.VideoConverter", MagicMock(return_value=converter))
+    return converter
+
+
+def test_main_convert_format(patched_path, mock_input_path, mock_converter, monkeypatch, capsys):
     """Test main function with format conversion."""
-    # Mock Path
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 1024 * 1024  # 1MB
     mock_input_path.stem = "test_video"
     mock_input_path.suffix = ".avi"
-    mock_path_class.return_value = mock_input_path
-
-    # Mock VideoConverter
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.convert_video_format.return_value = "converted/test_video.webm"
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "input.avi", "--format", "webm"])
@@ -41,19 +70,10 @@ def test_main_convert_format(mock_path_class, mock_video_converter_class, monkey
     mock_converter.convert_video_format.assert_called_once()
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_extract_audio(mock_path_class, mock_video_converter_class, monkeypatch, capsys):
+def test_main_extract_audio(patched_path, mock_input_path, mock_converter, monkeypatch, capsys):
     """Test main function with audio extraction."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 2048 * 1024  # 2MB
+    mock_input_path.st_size = 2048 * 1024  # 2MB
     mock_input_path.stem = "test_video"
-    mock_input_path.suffix = ".mp4"
-    mock_path_class.return_value = mock_input_path
-
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.extract_audio_from_video.return_value = "converted/test_video_audio.wav"
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "video.mp4", "--action", "extract_audio", "--format", "wav"])
@@ -67,19 +87,10 @@ def test_main_extract_audio(mock_path_class, mock_video_converter_class, monkeyp
     mock_converter.extract_audio_from_video.assert_called_once()
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_compress_video(mock_path_class, mock_video_converter_class, monkeypatch, capsys):
+def test_main_compress_video(patched_path, mock_input_path, mock_converter, monkeypatch, capsys):
     """Test main function with video compression."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 10240 * 1024  # 10MB
+    mock_input_path.st_size = 10240 * 1024  # 10MB
     mock_input_path.stem = "large_video"
-    mock_input_path.suffix = ".mp4"
-    mock_path_class.return_value = mock_input_path
-
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.compress_video.return_value = "converted/large_video_compressed.mp4"
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "large.mp4", "--action", "compress", "--quality", "medium"])
@@ -93,19 +104,10 @@ def test_main_compress_video(mock_path_class, mock_video_converter_class, monkey
     mock_converter.compress_video.assert_called_once()
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_change_resolution(mock_path_class, mock_video_converter_class, monkeypatch, capsys):
+def test_main_change_resolution(patched_path, mock_input_path, mock_converter, monkeypatch, capsys):
     """Test main function with resolution change."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 5120 * 1024  # 5MB
+    mock_input_path.st_size = 5120 * 1024  # 5MB
     mock_input_path.stem = "hd_video"
-    mock_input_path.suffix = ".mp4"
-    mock_path_class.return_value = mock_input_path
-
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.change_resolution.return_value = "converted/hd_video_1280x720.mp4"
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "hd.mp4", "--action", "change_resolution", "--resolution", "1280x720"])
@@ -131,15 +133,8 @@ def test_main_input_file_not_found(monkeypatch, capsys):
     assert "❌ Error: Input file 'nonexistent.mp4' not found" in captured.out
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_missing_resolution_for_change(mock_path_class, mock_video_converter_class, monkeypatch, capsys):
+def test_main_missing_resolution_for_change(patched_path, mock_converter, monkeypatch, capsys):
     """Test main function with resolution change but no resolution specified."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 1024 * 1024
-    mock_path_class.return_value = mock_input_path
-
     monkeypatch.setattr("sys.argv", ["convert_video.py", "video.mp4", "--action", "change_resolution"])
 
     with pytest.raises(SystemExit) as exc_info:
@@ -150,19 +145,8 @@ def test_main_missing_resolution_for_change(mock_path_class, mock_video_converte
     assert "--resolution required for resolution change" in captured.out
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_operation_failure(mock_path_class, mock_video_converter_class, monkeypatch, capsys):
+def test_main_operation_failure(patched_path, mock_converter, monkeypatch, capsys):
     """Test main function when operation fails."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 1024 * 1024
-    mock_input_path.stem = "test"
-    mock_input_path.suffix = ".mp4"
-    mock_path_class.return_value = mock_input_path
-
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.convert_video_format.return_value = None  # Operation failed
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "test.mp4", "--format", "webm"])
@@ -175,19 +159,9 @@ def test_main_operation_failure(mock_path_class, mock_video_converter_class, mon
     assert "❌ Operation failed" in captured.out
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_default_format_conversion(mock_path_class, mock_video_converter_class, monkeypatch):
+def test_main_default_format_conversion(patched_path, mock_input_path, mock_converter, monkeypatch):
     """Test main function with default format (webm) when no format specified."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 1024 * 1024
-    mock_input_path.stem = "test"
     mock_input_path.suffix = ".avi"
-    mock_path_class.return_value = mock_input_path
-
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.convert_video_format.return_value = "converted/test.webm"
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "test.avi"])
@@ -201,19 +175,8 @@ def test_main_default_format_conversion(mock_path_class, mock_video_converter_cl
     assert call_args[0][1] == "webm"
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_default_audio_format(mock_path_class, mock_video_converter_class, monkeypatch):
+def test_main_default_audio_format(patched_path, mock_converter, monkeypatch):
     """Test main function with default audio format (wav) when extracting audio."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 1024 * 1024
-    mock_input_path.stem = "test"
-    mock_input_path.suffix = ".mp4"
-    mock_path_class.return_value = mock_input_path
-
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.extract_audio_from_video.return_value = "converted/test_audio.wav"
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "test.mp4", "--action", "extract_audio"])
@@ -227,19 +190,8 @@ def test_main_default_audio_format(mock_path_class, mock_video_converter_class,
     assert call_args[0][1] == "wav"
 
 
-@patch('convert_video.VideoConverter')
-@patch('convert_video.Path')
-def test_main_default_compression_quality(mock_path_class, mock_video_converter_class, monkeypatch):
+def test_main_default_compression_quality(patched_path, mock_converter, monkeypatch):
     """Test main function with default compression quality (medium)."""
-    mock_input_path = MagicMock()
-    mock_input_path.exists.return_value = True
-    mock_input_path.stat.return_value.st_size = 1024 * 1024
-    mock_input_path.stem = "test"
-    mock_input_path.suffix = ".mp4"
-    mock_path_class.return_value = mock_input_path
-
-    mock_converter = MagicMock()
-    mock_video_converter_class.return_value = mock_converter
     mock_converter.compress_video.return_value = "converted/test_compressed.mp4"
 
     monkeypatch.setattr("sys.argv", ["convert_video.py", "test.mp4", "--action", "compress"])
@@ -250,4 +202,4 @@ def test_main_default_compression_quality(mock_path_class, mock_video_converter_
 
     # Verify it was called with medium quality
     call_args = mock_converter.compress_video.call_args
-    assert call_args[0][1] == "medium"
\ No newline at end of file
+    assert call_args[0][1] == "medium"
@@ -11,6 +11,30 @@ from unittest.mock import patch, MagicMock
 from src.converter.audio import AudioConverter
 
 
+@pytest.fixture(scope="module")
+def audio_converter_ro(tmp_path_factory):
+    """One AudioConverter shared by tests that never touch the filesystem.
+
+    Read-only tests (mocked subprocess/_run_ffmpeg, missing-file paths)
+    don't need a fresh output directory, so the mkdir in __init__ is
+    paid once per module instead of once per test.
+    """
+    return AudioConverter(output_dir=str(tmp_path_factory.mktemp("converted")))
+
+
+@pytest.fixture(scope="module")
+def dummy_inputs(tmp_path_factory):
+    """Dummy input files written once per module.
+
+    The conversion tests only need the inputs to exist; re-creating them
+    per test is eight needless open/write/close round-trips.
+    """
+    d = tmp_path_factory.mktemp("audio_inputs")
+    (d / "test.mp3").write_bytes(b"x")
+    (d / "test.wav").write_bytes(b"x")
+    return d
+
+
 @pytest.fixture
 def audio_converter(tmp_path):
     """Create an AudioConverter instance with temporary directory."""
@@ -22,6 +46,13 @@ def audio_converter(tmp_path):
 class TestAudioConverter:
     """Test suite for AudioConverter class."""
 
+    @pytest.fixture(autouse=True)
+    def mock_subprocess(self, monkeypatch):
+        """One subprocess.run mock for the class; no per-test @patch stack."""
+        mock_run = MagicMock()
+        monkeypatch.setattr('subprocess.run', mock_run)
+        return mock_run
+
     def test_initialization(self, tmp_path):
         """Test AudioConverter initialization."""
         output_dir = tmp_path / "test_output"
@@ -35,42 +66,37 @@ class TestAudioConverter:
         converter = AudioConverter()
         assert converter.output_dir == Path("./converted")
 
-    @patch('subprocess.run')
-    def test_run_ffmpeg_success(self, mock_subprocess, audio_converter):
+    def test_run_ffmpeg_success(self, mock_subprocess, audio_converter_ro):
         """Test successful FFmpeg execution."""
         mock_subprocess.return_value = MagicMock(returncode=0)
 
-        result = audio_converter._run_ffmpeg("input.mp3", "output.wav", [])
+        result = audio_converter_ro._run_ffmpeg("input.mp3", "output.wav", [])
         assert result is True
         mock_subprocess.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_run_ffmpeg_failure(self, mock_subprocess, audio_converter):
+    def test_run_ffmpeg_failure(self, mock_subprocess, audio_converter_ro):
         """Test FFmpeg execution failure."""
         mock_subprocess.side_effect = subprocess.CalledProcessError(1, 'ffmpeg', stderr="FFmpeg failed")
 
-        result = audio_converter._run_ffmpeg("input.mp3", "output.wav", [])
+        result = audio_converter_ro._run_ffmpeg("input.mp3", "output.wav", [])
         assert result is False
 
-    @patch('subprocess.run')
-    def test_run_ffmpeg_file_not_found(self, mock_subprocess, audio_converter):
+    def test_run_ffmpeg_file_not_found(self, mock_subprocess, audio_converter_ro):
         """Test FFmpeg not found."""
         mock_subprocess.side_effect = FileNotFoundError()
 
-        result = audio_converter._run_ffmpeg("input.mp3", "output.wav", [])
+        result = audio_converter_ro._run_ffmpeg("input.mp3", "output.wav", [])
         assert result is False
 
-    def test_convert_mp3_to_wav_file_not_exists(self, audio_converter):
+    def test_convert_mp3_to_wav_file_not_exists(self, audio_converter_ro):
         """Test MP3 to WAV conversion with non-existent file."""
-        result = audio_converter.convert_mp3_to_wav("nonexistent.mp3")
+        result = audio_converter_ro.convert_mp3_to_wav("nonexistent.mp3")
         assert result is None
 
     @patch('src.converter.audio.AudioConverter._run_ffmpeg')
-    def test_convert_mp3_to_wav_success(self, mock_run_ffmpeg, audio_converter, tmp_path):
+    def test_convert_mp3_to_wav_success(self, mock_run_ffmpeg, audio_converter, dummy_inputs):
         """Test successful MP3 to WAV conversion."""
-        # Create a dummy input file
-        input_file = tmp_path / "test.mp3"
-        input_file.write_text("dummy mp3 content")
+        input_file = dummy_inputs / "test.mp3"
 
         mock_run_ffmpeg.return_value = True
 
@@ -81,26 +107,24 @@ class TestAudioConverter:
         mock_run_ffmpeg.assert_called_once()
 
     @patch('src.converter.audio.AudioConverter._run_ffmpeg')
-    def test_convert_mp3_to_wav_failure(self, mock_run_ffmpeg, audio_converter, tmp_path):
+    def test_convert_mp3_to_wav_failure(self, mock_run_ffmpeg, audio_converter, dummy_inputs):
         """Test failed MP3 to WAV conversion."""
-        input_file = tmp_path / "test.mp3"
-        input_file.write_text("dummy mp3 content")
+        input_file = dummy_inputs / "test.mp3"
 
         mock_run_ffmpeg.return_value = False
 
         result = audio_converter.convert_mp3_to_wav(str(input_file))
         assert result is None
 
-    def test_convert_wav_to_mp3_file_not_exists(self, audio_converter):
+    def test_convert_wav_to_mp3_file_not_exists(self, audio_converter_ro):
         """Test WAV to MP3 conversion with non-existent file."""
-        result = audio_converter.convert_wav_to_mp3("nonexistent.wav")
+        result = audio_converter_ro.convert_wav_to_mp3("nonexistent.wav")
         assert result is None
 
     @patch('src.converter.audio.AudioConverter._run_ffmpeg')
-    def test_convert_wav_to_mp3_success(self, mock_run_ffmpeg, audio_converter, tmp_path):
+    def test_convert_wav_to_mp3_success(self, mock_run_ffmpeg, audio_converter, dummy_inputs):
         """Test successful WAV to MP3 conversion."""
-        input_file = tmp_path / "test.wav"
-        input_file.write_text("dummy wav content")
+        input_file = dummy_inputs / "test.wav"
 
         mock_run_ffmpeg.return_value = True
 
@@ -110,16 +134,15 @@ class TestAudioConverter:
         assert result.endswith(".mp3")
         mock_run_ffmpeg.assert_called_once()
 
-    def test_convert_audio_format_file_not_exists(self, audio_converter):
+    def test_convert_audio_format_file_not_exists(self, audio_converter_ro):
         """Test audio format conversion with non-existent file."""
-        result = audio_converter.convert_audio_format("nonexistent.mp3", "wav")
+        result = audio_converter_ro.convert_audio_format("nonexistent.mp3", "wav")
         assert result is None
 
     @patch('src.converter.audio.AudioConverter._run_ffmpeg')
-    def test_convert_audio_format_mp3(self, mock_run_ffmpeg, audio_converter, tmp_path):
+    def test_convert_audio_format_mp3(self, mock_run_ffmpeg, audio_converter, dummy_inputs):
         """Test audio format conversion to MP3."""
-        input_file = tmp_path / "test.wav"
-        input_file.write_text("dummy content")
+        input_file = dummy_inputs / "test.wav"
 
         mock_run_ffmpeg.return_value = True
 
@@ -133,10 +156,9 @@ class TestAudioConverter:
         assert "libmp3lame" in args
 
     @patch('src.converter.audio.AudioConverter._run_ffmpeg')
-    def test_convert_audio_format_flac(self, mock_run_ffmpeg, audio_converter, tmp_path):
+    def test_convert_audio_format_flac(self, mock_run_ffmpeg, audio_converter, dummy_inputs):
         """Test audio format conversion to FLAC."""
-        input_file = tmp_path / "test.wav"
-        input_file.write_text("dummy content")
+        input_file = dummy_inputs / "test.wav"
 
         mock_run_ffmpeg.return_value = True
 
@@ -148,17 +170,15 @@ class TestAudioConverter:
         assert "-acodec" in args
         assert "flac" in args
 
-    def test_get_audio_info_file_not_exists(self, audio_converter):
+    def test_get_audio_info_file_not_exists(self, audio_converter_ro):
         """Test getting audio info for non-existent file."""
-        result = audio_converter.get_audio_info("nonexistent.mp3")
+        result = audio_converter_ro.get_audio_info("nonexistent.mp3")
         assert result is None
 
-    @patch('subprocess.run')
     @patch('json.loads')
-    def test_get_audio_info_success(self, mock_json_loads, mock_subprocess, audio_converter, tmp_path):
+    def test_get_audio_info_success(self, mock_json_loads, mock_subprocess, audio_converter, dummy_inputs):
         """Test successful audio info retrieval."""
-        input_file = tmp_path / "test.mp3"
-        input_file.write_text("dummy content")
+        input_file = dummy_inputs / "test.mp3"
 
         mock_subprocess.return_value = MagicMock(returncode=0, stdout='{"test": "data"}')
         mock_json_loads.return_value = {"test": "data"}
@@ -168,22 +188,18 @@ class TestAudioConverter:
         assert result == {"test": "data"}
         mock_subprocess.assert_called_once()
 
-    @patch('subprocess.run')
-    def test_get_audio_info_ffprobe_not_found(self, mock_subprocess, audio_converter, tmp_path):
+    def test_get_audio_info_ffprobe_not_found(self, mock_subprocess, audio_converter, dummy_inputs):
         """Test audio info retrieval when ffprobe is not found."""
-        input_file = tmp_path / "test.mp3"
-        input_file.write_text("dummy content")
+        input_file = dummy_inputs / "test.mp3"
 
         mock_subprocess.side_effect = FileNotFoundError()
 
         result = audio_converter.get_audio_info(str(input_file))
         assert result is None
 
-    @patch('subprocess.run')
-    def test_get_audio_info_invalid_json(self, mock_subprocess, audio_converter, tmp_path):
+    def test_get_audio_info_invalid_json(self, mock_subprocess, audio_converter, dummy_inputs):
         """Test audio info retrieval with invalid JSON response."""
-        input_file = tmp_path / "test.mp3"
-        input_file.write_text("dummy content")
+        input_file = dummy_inputs / "test.mp3"
 
         mock_subprocess.return_value = MagicMock(returncode=0, stdout='invalid json')
 
@@ -39,18 +39,32 @@ class TestTextTranslator(unittest.TestCase):
         mock_instance.translate.assert_called_once_with("Hello world")
 
     @patch('src.translation.GoogleTranslator')
-    def test_translate_google_long_text_truncation(self, mock_google):
-        """Test Google Translate truncates long text."""
+    def test_translate_google_long_text_chunked(self, mock_google):
+        """Test Google Translate splits long text into chunks instead of truncating."""
         long_text = "A" * 6000  # Longer than 5000 chars
-        truncated_text = "A" * 5000
 
         mock_instance = MagicMock()
-        mock_instance.translate.return_value = "Translated text"
+        mock_instance.translate.return_value = "Translated chunk"
         mock_google.return_value = mock_instance
 
         result = self.translator._translate_google(long_text, "es")
-        self.assertEqual(result, "Translated text")
-        mock_instance.translate.assert_called_once_with(truncated_text)
+        self.assertEqual(result, "Translated chunk Translated chunk")
+
+        # All 6000 chars must be covered across the chunked calls
+        calls = mock_instance.translate.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(sum(len(call[0][0]) for call in calls), 6000)
+        for call in calls:
+            self.assertLessEqual(len(call[0][0]), 5000)
+
+    def test_split_for_google_sentence_packing(self):
+        """Test chunk splitting packs sentences and respects the limit."""
+        text = "First sentence. " + "Second one! " + "B" * 5000 + ". Tail."
+        chunks = self.translator._split_for_google(text)
+
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk), self.translator.GOOGLE_CHUNK_LIMIT)
 
     @patch('src.translation.GoogleTranslator')
     def test_translate_google_failure(self, mock_google):